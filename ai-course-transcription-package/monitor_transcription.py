@@ -5,6 +5,7 @@ error detection, and automatic recovery.
 """
 
 import json
+import re
 import time
 import os
 import sys
@@ -12,6 +13,56 @@ from pathlib import Path
 from datetime import datetime, timedelta
 import threading
 import signal
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Recording dates embedded in temp file paths, e.g. .../week_1_class_1_2024-06-18.mp4
+_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+
+# Most recent completions re-stat'ed every tick, since they may still be written to
+RECENT_CONFIRMED = 5
+
+
+def _read_json(path):
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _newest_mp4(root, stop=None):
+    """Walk a directory tree and return (mtime, path) of the newest .mp4 file.
+    
+    Returns early with the best match so far once `stop` is set.
+    """
+    newest = (0, None)
+    stack = [root]
+    while stack:
+        if stop is not None and stop.is_set():
+            break
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith('.mp4'):
+                            mtime = entry.stat().st_mtime
+                            if mtime > newest[0]:
+                                newest = (mtime, entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return newest
+
 
 class TranscriptionMonitor:
     def __init__(self, manifest_path="s3_manifest_cohort3.json"):
@@ -19,17 +70,54 @@ class TranscriptionMonitor:
         self.checkpoint_path = "logs/cohort3_checkpoint.json"
         self.status_path = "logs/transcription_status.json"
         self.log_path = "logs/monitor.log"
-        self.running = True
+        self._stop = threading.Event()
         
         # Load manifest
-        with open(manifest_path, 'r') as f:
-            self.manifest = json.load(f)
+        self.manifest = _read_json(manifest_path)
         
         self.total_videos = len(self.manifest['videos'])
+        
+        # Index videos by recording date for matching temp files, and
+        # precompute the transcript names checked on every tick
+        self._date_index = {}
+        self._videos_by_dir = {}
+        for video in self.manifest['videos']:
+            self._date_index.setdefault(video['date'], video)
+            basename = os.path.basename(video['output_path'])
+            video['_dir'] = os.path.dirname(video['output_path']) or '.'
+            video['_txt'] = f"{basename}.txt"
+            video['_json'] = f"{basename}.json"
+            video['_id'] = f"week_{video['week']}_class_{video['lesson']}"
+            self._videos_by_dir.setdefault(video['_dir'], []).append(video)
+        
+        # Completions are monotonic, so confirmed transcripts are only
+        # re-checked when their output directory changes
+        self._confirmed_complete = {}
+        self._dir_mtimes = {}
+        self._recent_confirmed = deque(maxlen=RECENT_CONFIRMED)
         self.start_time = None
         self.current_video = None
         self.completed_videos = set()
         self.failed_videos = []
+        self._last_proc_scan = None
+        self._status_generation = 0
+        self._status_completed_count = None
+        self._last_status_signature = None
+        self._status_idle_ticks = 0
+        
+        # Progress bar strings indexed by filled width
+        self._bars = ["█" * i + "░" * (50 - i) for i in range(51)]
+        
+        # Prime psutil so later non-blocking CPU samples have a baseline
+        try:
+            import psutil
+            psutil.cpu_percent(interval=None)
+        except ImportError:
+            pass
+        
+        # Enable ANSI escape processing on Windows consoles
+        if os.name == 'nt':
+            os.system('')
         
         # Setup signal handler for graceful shutdown
         signal.signal(signal.SIGINT, self.signal_handler)
@@ -37,40 +125,87 @@ class TranscriptionMonitor:
     def signal_handler(self, sig, frame):
         """Handle Ctrl+C gracefully."""
         print("\n\n⚠️  Monitoring stopped by user")
-        self.running = False
-        sys.exit(0)
+        # Let the loop exit at the next boundary rather than mid-write
+        self._stop.set()
     
     def clear_screen(self):
         """Clear terminal screen."""
-        os.system('clear' if os.name == 'posix' else 'cls')
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
     
     def load_checkpoint(self):
         """Load checkpoint to get completed videos."""
         if os.path.exists(self.checkpoint_path):
-            with open(self.checkpoint_path, 'r') as f:
-                checkpoint = json.load(f)
-                return set(checkpoint.get('completed', []))
+            checkpoint = _read_json(self.checkpoint_path)
+            return set(checkpoint.get('completed', []))
         return set()
     
     def check_completed_files(self):
         """Check actual transcript files on disk."""
-        completed = []
-        for video in self.manifest['videos']:
-            txt_path = Path(f"{video['output_path']}.txt")
-            json_path = Path(f"{video['output_path']}.json")
+        # Appending to a file doesn't touch its directory's mtime, so refresh
+        # the newest confirmations directly
+        for video in self._recent_confirmed:
+            entry = self._confirmed_complete.get(video['_id'])
+            if entry is None:
+                continue
+            try:
+                txt_stat = os.stat(os.path.join(video['_dir'], video['_txt']))
+            except OSError:
+                continue
+            entry['size_mb'] = txt_stat.st_size / (1024*1024)
+            entry['modified'] = datetime.fromtimestamp(txt_stat.st_mtime)
+        
+        for out_dir, videos in self._videos_by_dir.items():
+            try:
+                dir_mtime = os.stat(out_dir).st_mtime_ns
+            except OSError:
+                dir_mtime = None
+            
+            if self._dir_mtimes.get(out_dir) != dir_mtime:
+                # Entries were added, removed or renamed; re-check everything
+                self._dir_mtimes[out_dir] = dir_mtime
+                for video in videos:
+                    self._confirmed_complete.pop(video['_id'], None)
             
-            if txt_path.exists() and json_path.exists():
+            pending = [v for v in videos if v['_id'] not in self._confirmed_complete]
+            if not pending or dir_mtime is None:
+                continue
+            
+            # List the directory once instead of stat-ing every path
+            try:
+                with os.scandir(out_dir) as it:
+                    entries = {entry.name: entry for entry in it}
+            except OSError:
+                continue
+            
+            for video in pending:
+                txt_entry = entries.get(video['_txt'])
+                if txt_entry is None or video['_json'] not in entries:
+                    continue
+                
+                # Stat once and reuse the result for size and mtime
+                try:
+                    txt_stat = txt_entry.stat()
+                except FileNotFoundError:
+                    continue
+                
                 # Check file size to ensure it's not empty
-                if txt_path.stat().st_size > 100:
-                    video_id = f"week_{video['week']}_class_{video['lesson']}"
-                    completed.append({
-                        'id': video_id,
+                if txt_stat.st_size > 100:
+                    self._confirmed_complete[video['_id']] = {
+                        'id': video['_id'],
                         'week': video['week'],
                         'lesson': video['lesson'],
-                        'size_mb': txt_path.stat().st_size / (1024*1024),
-                        'modified': datetime.fromtimestamp(txt_path.stat().st_mtime)
-                    })
-        return completed
+                        'size_mb': txt_stat.st_size / (1024*1024),
+                        'modified': datetime.fromtimestamp(txt_stat.st_mtime)
+                    }
+                    if video not in self._recent_confirmed:
+                        self._recent_confirmed.append(video)
+        
+        return [
+            self._confirmed_complete[video['_id']]
+            for video in self.manifest['videos']
+            if video['_id'] in self._confirmed_complete
+        ]
     
     def estimate_time_remaining(self, completed_count, elapsed_time):
         """Estimate remaining time based on current progress."""
@@ -84,31 +219,89 @@ class TranscriptionMonitor:
         
         return timedelta(seconds=int(estimated_remaining))
     
-    def get_current_processing(self):
-        """Detect which video is currently being processed."""
-        # Check for most recently modified temp files
-        temp_dir = Path("/var/folders")
+    def find_latest_temp_video(self, temp_dir="/var/folders"):
+        """Return (path, mtime) of the newest temp .mp4, reusing the last scan when unchanged."""
+        with os.scandir(temp_dir) as it:
+            entries = list(it)
+        
+        # Top-level directory mtimes only change when entries are added or removed
+        top_mtimes = (os.stat(temp_dir).st_mtime_ns,) + tuple(
+            entry.stat(follow_symlinks=False).st_mtime_ns for entry in entries
+        )
+        if self._last_proc_scan:
+            cached_mtimes, cached_result, scanned_at = self._last_proc_scan
+            # Temp videos land several levels below temp_dir, where the top-level
+            # mtimes don't see them; the last hit's directory is where the next
+            # download usually appears, so a change there also invalidates
+            try:
+                hit_mtime = os.stat(os.path.dirname(cached_result[0])).st_mtime_ns
+            except OSError:
+                hit_mtime = None
+            if (cached_mtimes == top_mtimes + (hit_mtime,)
+                    and (time.time() - scanned_at) < 300):
+                return cached_result
+        
         latest_mp4 = None
         latest_time = 0
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith('.mp4'):
+                mtime = entry.stat().st_mtime
+                if mtime > latest_time:
+                    latest_time = mtime
+                    latest_mp4 = entry.path
         
+        # Walk each subtree in parallel and stop once a recent file turns up.
+        # No with-block: its exit would wait for walkers still deep in other trees
+        stop = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=8)
         try:
-            for mp4_file in temp_dir.rglob("*.mp4"):
-                if mp4_file.stat().st_mtime > latest_time:
-                    latest_time = mp4_file.stat().st_mtime
-                    latest_mp4 = mp4_file
+            futures = [pool.submit(_newest_mp4, subdir, stop) for subdir in subdirs]
+            for future in as_completed(futures):
+                mtime, path = future.result()
+                if mtime > latest_time:
+                    latest_time = mtime
+                    latest_mp4 = path
+                if (time.time() - latest_time) < 600:
+                    break
+        finally:
+            # Running walkers see the flag at their next directory and return
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+        
+        # Only cache a hit: with nothing found there is no directory to key on,
+        # and a new download anywhere in the tree must show up on the next tick
+        if latest_mp4:
+            try:
+                hit_mtime = os.stat(os.path.dirname(latest_mp4)).st_mtime_ns
+            except OSError:
+                hit_mtime = None
+            self._last_proc_scan = (top_mtimes + (hit_mtime,), (latest_mp4, latest_time), time.time())
+        else:
+            self._last_proc_scan = None
+        return latest_mp4, latest_time
+    
+    def get_current_processing(self):
+        """Detect which video is currently being processed."""
+        try:
+            # Check for most recently modified temp files
+            latest_mp4, latest_time = self.find_latest_temp_video()
                     
             # If we found a recent temp file (modified in last 10 minutes)
             if latest_mp4 and (time.time() - latest_time) < 600:
                 # Try to match with manifest
-                for video in self.manifest['videos']:
-                    if f"{video['date']}" in str(latest_mp4):
+                for date in _DATE_RE.findall(str(latest_mp4)):
+                    video = self._date_index.get(date)
+                    if video:
                         return f"Week {video['week']} Class {video['lesson']}"
         except:
             pass
         
         return None
     
-    def display_status(self):
+    def display_status(self, completed_files=None):
         """Display current transcription status."""
         self.clear_screen()
         
@@ -119,14 +312,13 @@ class TranscriptionMonitor:
         print()
         
         # Get current status
-        completed_files = self.check_completed_files()
+        if completed_files is None:
+            completed_files = self.check_completed_files()
         completed_count = len(completed_files)
         
         # Progress bar
         progress = completed_count / self.total_videos
-        bar_length = 50
-        filled = int(bar_length * progress)
-        bar = "█" * filled + "░" * (bar_length - filled)
+        bar = self._bars[int(50 * min(progress, 1.0))]
         
         print(f"Progress: [{bar}] {progress*100:.1f}%")
         print(f"Status:   {completed_count}/{self.total_videos} videos completed")
@@ -145,6 +337,7 @@ class TranscriptionMonitor:
         
         # Current processing
         current = self.get_current_processing()
+        self.current_video = current
         if current:
             print(f"🔄 Currently Processing: {current}")
         else:
@@ -168,7 +361,8 @@ class TranscriptionMonitor:
         # System resources
         try:
             import psutil
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # Non-blocking: usage since the previous call (primed in __init__)
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
             
             print("💻 System Resources:")
@@ -182,9 +376,24 @@ class TranscriptionMonitor:
         print("Press Ctrl+C to stop monitoring")
         print("Status updates every 30 seconds...")
     
-    def write_status_file(self):
+    def write_status_file(self, completed_files=None):
         """Write current status to JSON file for external monitoring."""
-        completed_files = self.check_completed_files()
+        if completed_files is None:
+            completed_files = self.check_completed_files()
+        
+        # Skip the write when nothing changed, but still refresh every 10th tick
+        signature = (len(completed_files), self.current_video)
+        if signature == self._last_status_signature and self._status_idle_ticks < 9:
+            self._status_idle_ticks += 1
+            return
+        self._last_status_signature = signature
+        self._status_idle_ticks = 0
+        
+        # Bump the generation only when the completed count changes so
+        # pollers can skip re-reading an unchanged status
+        if len(completed_files) != self._status_completed_count:
+            self._status_completed_count = len(completed_files)
+            self._status_generation += 1
         
         status = {
             'timestamp': datetime.now().isoformat(),
@@ -194,7 +403,8 @@ class TranscriptionMonitor:
             'progress_percent': (len(completed_files) / self.total_videos) * 100,
             'completed_videos': [v['id'] for v in completed_files],
             'start_time': self.start_time,
-            'estimated_completion': None
+            'estimated_completion': None,
+            'status_generation': self._status_generation
         }
         
         if self.start_time and len(completed_files) > 0:
@@ -202,8 +412,15 @@ class TranscriptionMonitor:
             remaining = self.estimate_time_remaining(len(completed_files), elapsed)
             status['estimated_completion'] = (datetime.now() + remaining).isoformat()
         
-        with open(self.status_path, 'w') as f:
-            json.dump(status, f, indent=2)
+        # Write to a temp file and swap it in so readers never see a partial file
+        tmp_path = self.status_path + '.tmp'
+        if orjson:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(status, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, 'w') as f:
+                json.dump(status, f, indent=2)
+        os.replace(tmp_path, self.status_path)
     
     def monitor_loop(self):
         """Main monitoring loop."""
@@ -214,14 +431,15 @@ class TranscriptionMonitor:
         print()
         time.sleep(2)
         
-        while self.running:
+        while not self._stop.is_set():
             try:
-                self.display_status()
-                self.write_status_file()
+                # Scan disk once per tick and share the result
+                completed_files = self.check_completed_files()
+                self.display_status(completed_files)
+                self.write_status_file(completed_files)
                 
                 # Check if all completed
-                completed_count = len(self.check_completed_files())
-                if completed_count >= self.total_videos:
+                if len(completed_files) >= self.total_videos:
                     self.clear_screen()
                     print("🎉 ALL VIDEOS TRANSCRIBED SUCCESSFULLY! 🎉")
                     print()
@@ -229,14 +447,15 @@ class TranscriptionMonitor:
                     print(f"Total time: {timedelta(seconds=int(time.time() - self.start_time))}")
                     break
                 
-                # Wait 30 seconds before next update
-                time.sleep(30)
+                # Wait 30 seconds before next update, waking immediately on shutdown
+                if self._stop.wait(30):
+                    break
                 
             except KeyboardInterrupt:
                 break
             except Exception as e:
                 print(f"Error in monitoring: {e}")
-                time.sleep(5)
+                self._stop.wait(5)
 
 def main():
     """Main entry point."""
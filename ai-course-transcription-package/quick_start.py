@@ -11,6 +11,9 @@ from pathlib import Path
 import subprocess
 import logging
 
+# Estimated disk usage per video: 5 MB transcript + 2 MB analysis
+STORAGE_PER_VIDEO_MB = 7
+
 def setup_logging():
     """Setup basic logging."""
     logging.basicConfig(
@@ -54,19 +57,25 @@ def discover_videos():
     videos_by_cohort = {}
     total_videos = 0
     
-    for cohort_dir in cohorts_path.iterdir():
-        if cohort_dir.is_dir() and cohort_dir.name.startswith('cohort_'):
-            videos = []
-            
-            for week_dir in cohort_dir.iterdir():
-                if week_dir.is_dir():
-                    for file_path in week_dir.iterdir():
-                        if file_path.suffix.lower() in video_extensions:
-                            videos.append(file_path)
-            
-            if videos:
-                videos_by_cohort[cohort_dir.name] = videos
-                total_videos += len(videos)
+    # Single walk over cohorts/<cohort>/<week>/<file>, pruning everything else
+    for root, dirs, files in os.walk(cohorts_path):
+        rel_parts = Path(root).relative_to(cohorts_path).parts
+        
+        if not rel_parts:
+            dirs[:] = [d for d in dirs if d.startswith('cohort_')]
+            continue
+        if len(rel_parts) < 2:
+            continue
+        
+        # Week directories are the deepest level scanned
+        dirs[:] = []
+        videos = [
+            Path(root) / name for name in files
+            if os.path.splitext(name)[1].lower() in video_extensions
+        ]
+        if videos:
+            videos_by_cohort.setdefault(rel_parts[0], []).extend(videos)
+            total_videos += len(videos)
     
     logger.info(f"📁 Found videos in {len(videos_by_cohort)} cohorts:")
     for cohort, videos in videos_by_cohort.items():
@@ -102,24 +111,21 @@ def check_storage_space(total_videos):
     logger = logging.getLogger(__name__)
     
     # Estimate storage needs
-    estimated_transcript_size = total_videos * 5  # MB per transcript
-    estimated_analysis_size = total_videos * 2   # MB per analysis
-    total_needed_mb = estimated_transcript_size + estimated_analysis_size
+    total_needed_mb = total_videos * STORAGE_PER_VIDEO_MB
     
     # Check available space
     stat = os.statvfs('.')
     available_mb = (stat.f_bavail * stat.f_frsize) // (1024 * 1024)
     
+    if available_mb >= total_needed_mb * 1.5:  # 50% buffer
+        logger.info(f"✅ Sufficient storage available ({total_needed_mb} MB needed, {available_mb} MB free)")
+        return True
+    
     logger.info(f"💾 Storage requirements:")
     logger.info(f"  Estimated needed: {total_needed_mb} MB")
     logger.info(f"  Available: {available_mb} MB")
-    
-    if available_mb < total_needed_mb * 1.5:  # 50% buffer
-        logger.warning(f"⚠️ Low disk space! Consider freeing up space.")
-        return False
-    
-    logger.info("✅ Sufficient storage available")
-    return True
+    logger.warning(f"⚠️ Low disk space! Consider freeing up space.")
+    return False
 
 def run_processing(mode="full"):
     """Run the processing workflow."""
@@ -106,6 +106,18 @@ def run_batch_with_checkpointing():
             checkpoint = json.load(f)
             completed = set(checkpoint.get('completed', []))
     
+    # The robust runner journals results between snapshots; count those too
+    journal_path = os.path.splitext(checkpoint_path)[0] + ".jsonl"
+    if os.path.exists(journal_path):
+        with open(journal_path, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry['status'] == 'done':
+                    completed.add(entry['video_id'])
+    
     # Initialize transcriber
     transcriber = S3BatchTranscriber(
         model_size="base",
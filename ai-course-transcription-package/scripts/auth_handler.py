@@ -6,10 +6,13 @@ Supports both Selenium and Playwright for robust authentication.
 
 import json
 import os
+import shutil
 import time
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse, urljoin
 import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -28,8 +31,11 @@ class AuthHandler:
     def __init__(self, base_url: str = "https://aitra-legacy-content.vercel.app/"):
         self.base_url = base_url
         self.session = requests.Session()
+        # Keep connections alive across video downloads
+        self.session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8))
         self.driver = None
         self.authenticated = False
+        self._ensured_dirs = set()
         
     def load_credentials(self, credentials_path: str = "../config/credentials.json") -> Dict[str, str]:
         """Load authentication credentials from JSON file."""
@@ -169,16 +175,19 @@ class AuthHandler:
         """Download a video file using authenticated session."""
         try:
             # Use requests session with cookies from Selenium
-            response = self.session.get(video_url, stream=True)
-            response.raise_for_status()
-            
-            # Create output directory if it doesn't exist
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            with self.session.get(video_url, stream=True) as response:
+                response.raise_for_status()
+                
+                # Create output directory if it doesn't exist (once per directory)
+                output_dir = os.path.dirname(output_path)
+                if output_dir not in self._ensured_dirs:
+                    os.makedirs(output_dir, exist_ok=True)
+                    self._ensured_dirs.add(output_dir)
+                
+                # Copy in 1 MiB blocks; decode_content handles gzip/deflate transfer encoding
+                response.raw.decode_content = True
+                with open(output_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=1024 * 1024)
             
             logger.info(f"Downloaded: {output_path}")
             return True
@@ -187,6 +196,25 @@ class AuthHandler:
             logger.error(f"Failed to download {video_url}: {e}")
             return False
     
+    def download_videos(self, items: List[Tuple[str, str]], max_workers: int = 6) -> Dict[str, bool]:
+        """Download several videos concurrently, returning success by output path."""
+        # Bounded to stay within the session's connection pool and be polite to the origin
+        max_workers = max(1, min(max_workers, 8))
+        results = {}
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_path = {
+                executor.submit(self.download_video, video_url, output_path): output_path
+                for video_url, output_path in items
+            }
+            
+            for completed, future in enumerate(as_completed(future_to_path), 1):
+                output_path = future_to_path[future]
+                results[output_path] = future.result()
+                logger.info(f"Download progress: {completed}/{len(items)}")
+        
+        return results
+    
     def save_session_manifest(self, video_urls: Dict[str, List[str]], output_path: str = "../config/video_manifest.json"):
         """Save discovered video URLs to JSON manifest."""
         try:
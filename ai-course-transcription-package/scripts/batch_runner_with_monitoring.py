@@ -6,31 +6,156 @@ Robust batch transcription runner with checkpointing, error recovery, and monito
 import json
 import sys
 import os
+import random
 import time
 import traceback
 from pathlib import Path
 from datetime import datetime
 import threading
 import signal
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from s3_batch_transcriber import S3BatchTranscriber
+import requests
+import urllib3.exceptions
+from botocore.exceptions import ClientError, EndpointConnectionError, HTTPClientError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Retry delays: min(cap, base * 2**attempt), stretched by up to 50% jitter
+RETRY_BASE_SECONDS = 1.0
+RETRY_CAP_SECONDS = 30.0
+RATE_LIMIT_BASE_SECONDS = 10.0
+RATE_LIMIT_CAP_SECONDS = 120.0
+
+# Circuit breaker: open after this many consecutive recoverable failures,
+# then wait before letting a single probe request through
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_OPEN_SECONDS = 300
+# A video is failed, and the run stopped, after this many probes fail in a row
+BREAKER_MAX_PROBES = 3
+
+# Fold the journal into the snapshot at least this often, so readers of the
+# snapshot alone (the shell status checks) stay current during a run
+CHECKPOINT_INTERVAL_SECONDS = 60
+
+
+def _read_json(path):
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _dumps(obj):
+    """Encode to compact JSON bytes, using orjson when it is installed."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+_loads = orjson.loads if orjson else json.loads
+
+
+class RecoverableError(Exception):
+    """Transient failure (network, timeout, 5xx) that is worth retrying."""
+
+
+class RateLimitedError(RecoverableError):
+    """The origin asked us to slow down (HTTP 429 / S3 SlowDown)."""
+
+
+class UnrecoverableError(Exception):
+    """Permanent failure (bad URL, missing object, access denied)."""
+
+
+class CircuitOpenError(Exception):
+    """Requests are paused after repeated failures against the origin."""
+
+
+def classify_error(error):
+    """Map an exception raised while processing a video onto the retry hierarchy."""
+    if isinstance(error, (RecoverableError, UnrecoverableError)):
+        return type(error)
+    
+    status = None
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+    elif isinstance(error, ClientError):
+        if error.response.get('Error', {}).get('Code') in ('SlowDown', 'Throttling', 'RequestLimitExceeded'):
+            return RateLimitedError
+        status = error.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+    
+    if status == 429:
+        return RateLimitedError
+    if status is not None:
+        return RecoverableError if status >= 500 else UnrecoverableError
+    
+    # HTTPClientError covers botocore's read timeouts and dropped streams from the
+    # ranged S3 reader; bare urllib3 errors can still leak out of raw body reads
+    if isinstance(error, (requests.ConnectionError, requests.Timeout,
+                          requests.exceptions.ChunkedEncodingError,
+                          EndpointConnectionError, HTTPClientError,
+                          urllib3.exceptions.ProtocolError, urllib3.exceptions.ReadTimeoutError,
+                          ConnectionError, TimeoutError)):
+        return RecoverableError
+    return UnrecoverableError
+
+
+def is_permanent_failure(error):
+    """True when the URL or object itself is bad, so later runs shouldn't retry it."""
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code in (403, 404, 410)
+    if isinstance(error, ClientError):
+        code = error.response.get('Error', {}).get('Code')
+        return code in ('NoSuchKey', 'NoSuchBucket', 'AccessDenied', '403', '404')
+    return isinstance(error, (requests.exceptions.InvalidURL, requests.exceptions.MissingSchema))
+
+
+def retry_delay(error_class, retry_count):
+    """Capped exponential backoff with jitter for the given error class."""
+    if issubclass(error_class, RateLimitedError):
+        base, cap = RATE_LIMIT_BASE_SECONDS, RATE_LIMIT_CAP_SECONDS
+    else:
+        base, cap = RETRY_BASE_SECONDS, RETRY_CAP_SECONDS
+    return min(cap, base * (2 ** retry_count)) * (1 + random.random() * 0.5)
+
+
+def _remove_prefetched_file(future):
+    """Done-callback that deletes an abandoned prefetch download."""
+    try:
+        path = future.result()
+    except Exception:
+        return
+    try:
+        if path and os.path.exists(path):
+            os.remove(path)
+    except OSError:
+        pass
+
 
 class RobustBatchRunner:
     def __init__(self, manifest_path, checkpoint_path="logs/cohort3_checkpoint.json"):
         self.manifest_path = manifest_path
         self.checkpoint_path = checkpoint_path
-        self.error_log_path = "logs/transcription_errors.json"
+        self.journal_path = os.path.splitext(checkpoint_path)[0] + ".jsonl"
+        self.error_log_path = "logs/transcription_errors.jsonl"
         self.status_log_path = "logs/transcription_status.json"
         
         # Create logs directory
         os.makedirs("logs", exist_ok=True)
         
         # Load manifest
-        with open(manifest_path, 'r') as f:
-            self.manifest = json.load(f)
+        self.manifest = _read_json(manifest_path)
+        self._total = len(self.manifest['videos'])
         
         # Initialize transcriber
         self.transcriber = S3BatchTranscriber(
@@ -42,24 +167,47 @@ class RobustBatchRunner:
         # State tracking
         self.completed = set()
         self.failed = {}
+        self.permanent_failed = set()
         self.current_video = None
         self.start_time = time.time()
-        self.stop_requested = False
+        self._stop = threading.Event()
+        self._journal_entries = 0
+        self._last_snapshot = time.time()
+        
+        # Circuit breaker state (open while time.time() < _breaker_until)
+        self._consec_fail = 0
+        self._breaker_until = 0
+        self._half_open = False
+        
+        # Next video is downloaded in the background while the current one transcribes
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        self._prefetched = {}
+        
+        # Status snapshots are handed to a background writer (at most 1 write/sec)
+        self._status = {}
+        self._last_status_tuple = None
+        self._status_dirty = None
+        self._status_event = threading.Event()
+        self._status_lock = threading.Lock()
+        threading.Thread(target=self._status_writer, daemon=True).start()
         
         # Setup signal handler
         signal.signal(signal.SIGINT, self.signal_handler)
         
         # Load existing checkpoint
         self.load_checkpoint()
+        
+        # Index existing transcript sizes once instead of stat-ing per video
+        self._existing_sizes = self._scan_existing_outputs()
     
     def signal_handler(self, sig, frame):
         """Handle graceful shutdown."""
         print("\n\n⚠️  Stopping after current video completes...")
         print("   (Press Ctrl+C again to force stop)")
-        self.stop_requested = True
         
-        # Save checkpoint
-        self.save_checkpoint()
+        # Only flag the stop here; the run loop saves the checkpoint outside
+        # the handler so a half-written snapshot can't be interrupted
+        self._stop.set()
         
         # Second Ctrl+C forces exit
         signal.signal(signal.SIGINT, signal.SIG_DFL)
@@ -68,80 +216,254 @@ class RobustBatchRunner:
         """Load existing checkpoint if available."""
         if os.path.exists(self.checkpoint_path):
             try:
-                with open(self.checkpoint_path, 'r') as f:
-                    checkpoint = json.load(f)
-                    self.completed = set(checkpoint.get('completed', []))
-                    self.failed = checkpoint.get('failed', {})
-                    print(f"📂 Loaded checkpoint: {len(self.completed)} completed, {len(self.failed)} failed")
+                checkpoint = _read_json(self.checkpoint_path)
+                self.completed = set(checkpoint.get('completed', []))
+                self.failed = checkpoint.get('failed', {})
+                self.permanent_failed = set(checkpoint.get('permanent_failed', []))
             except Exception as e:
                 print(f"⚠️  Could not load checkpoint: {e}")
+        
+        # Replay results recorded since the last snapshot
+        if os.path.exists(self.journal_path):
+            try:
+                with open(self.journal_path, 'rb') as f:
+                    for line in f:
+                        try:
+                            entry = _loads(line)
+                        except ValueError:
+                            continue  # Partial line from an interrupted write
+                        self._apply_journal_entry(entry)
+                        self._journal_entries += 1
+            except Exception as e:
+                print(f"⚠️  Could not replay checkpoint journal: {e}")
+        
+        if self.completed or self.failed:
+            print(f"📂 Loaded checkpoint: {len(self.completed)} completed, {len(self.failed)} failed")
+    
+    def _apply_journal_entry(self, entry):
+        """Apply one journal record to the in-memory state."""
+        video_id = entry['video_id']
+        if entry['status'] == 'done':
+            self.completed.add(video_id)
+            self.failed.pop(video_id, None)
+            self.permanent_failed.discard(video_id)
+        elif entry['status'] == 'failed':
+            self.failed[video_id] = entry['attempts']
+            if entry.get('permanent'):
+                self.permanent_failed.add(video_id)
+    
+    def record_result(self, video_id, success):
+        """Append a single video result to the checkpoint journal."""
+        if success:
+            entry = {'video_id': video_id, 'status': 'done'}
+        else:
+            entry = {'video_id': video_id, 'status': 'failed', 'attempts': self.failed[video_id]}
+            if video_id in self.permanent_failed:
+                entry['permanent'] = True
+        
+        try:
+            with open(self.journal_path, 'ab') as f:
+                f.write(_dumps(entry) + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._journal_entries += 1
+        except Exception as e:
+            print(f"⚠️  Could not record result: {e}")
+        
+        # Periodically fold the journal into a fresh snapshot
+        if (self._journal_entries >= 100
+                or time.time() - self._last_snapshot >= CHECKPOINT_INTERVAL_SECONDS):
+            self.save_checkpoint()
     
     def save_checkpoint(self):
-        """Save current progress to checkpoint."""
+        """Write a full snapshot of progress and reset the journal."""
         checkpoint = {
             'completed': list(self.completed),
             'failed': self.failed,
+            'permanent_failed': list(self.permanent_failed),
             'timestamp': datetime.now().isoformat(),
-            'total_videos': len(self.manifest['videos'])
+            'total_videos': self._total
         }
         
         try:
-            with open(self.checkpoint_path, 'w') as f:
-                json.dump(checkpoint, f, indent=2)
+            tmp_path = self.checkpoint_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(checkpoint))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.checkpoint_path)
+            
+            # Journal entries are now covered by the snapshot
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+            self._journal_entries = 0
+            self._last_snapshot = time.time()
         except Exception as e:
             print(f"⚠️  Could not save checkpoint: {e}")
     
     def save_error_log(self, video_id, error_details):
-        """Save error details for debugging."""
-        errors = {}
-        if os.path.exists(self.error_log_path):
-            try:
-                with open(self.error_log_path, 'r') as f:
-                    errors = json.load(f)
-            except:
-                pass
-        
-        errors[video_id] = {
+        """Append one error record (a JSON line) for debugging."""
+        entry = {
             'timestamp': datetime.now().isoformat(),
-            'error': str(error_details),
-            'traceback': traceback.format_exc()
+            'video_id': video_id,
+            'error': str(error_details)
         }
         
-        with open(self.error_log_path, 'w') as f:
-            json.dump(errors, f, indent=2)
+        # Tracebacks only for unexpected failures; transient network errors don't need them
+        if not issubclass(classify_error(error_details), RecoverableError):
+            entry['traceback'] = traceback.format_exc()
+        
+        try:
+            with open(self.error_log_path, 'ab') as f:
+                f.write(_dumps(entry) + b"\n")
+        except OSError as e:
+            print(f"⚠️  Could not write error log: {e}")
     
     def update_status(self, current_video=None, phase="processing"):
         """Update status file for monitoring."""
-        status = {
-            'timestamp': datetime.now().isoformat(),
-            'phase': phase,
-            'current_video': current_video,
-            'completed': len(self.completed),
-            'failed': len(self.failed),
-            'total': len(self.manifest['videos']),
-            'progress_percent': (len(self.completed) / len(self.manifest['videos'])) * 100,
-            'elapsed_seconds': time.time() - self.start_time
-        }
+        completed = len(self.completed)
+        failed = len(self.failed)
         
-        try:
-            with open(self.status_log_path, 'w') as f:
-                json.dump(status, f, indent=2)
-        except:
-            pass
+        # Nothing a reader cares about has changed since the last update
+        status_tuple = (phase, current_video, completed, failed)
+        if status_tuple == self._last_status_tuple:
+            return
+        self._last_status_tuple = status_tuple
+        
+        # One dict updated in place; the lock keeps the writer from encoding it mid-update
+        with self._status_lock:
+            self._status.update(
+                timestamp=datetime.now().isoformat(),
+                phase=phase,
+                current_video=current_video,
+                completed=completed,
+                failed=failed,
+                total=self._total,
+                progress_percent=(completed / self._total) * 100 if self._total else 0,
+                elapsed_seconds=time.time() - self.start_time
+            )
+            self._status_dirty = self._status
+        self._status_event.set()
+    
+    def _status_writer(self):
+        """Flush the latest status snapshot, at most once per second."""
+        while True:
+            self._status_event.wait()
+            self._flush_status()
+            time.sleep(1.0)
+    
+    def _flush_status(self):
+        """Atomically write any pending status so readers never see partial JSON."""
+        with self._status_lock:
+            # Clear before taking the snapshot so a concurrent update re-arms the event
+            self._status_event.clear()
+            status, self._status_dirty = self._status_dirty, None
+            if status is None:
+                return
+            
+            try:
+                tmp_path = self.status_log_path + ".tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(_dumps(status))
+                os.replace(tmp_path, self.status_log_path)
+            except OSError:
+                pass
+    
+    def _scan_existing_outputs(self):
+        """Map transcript .txt/.json paths in the manifest's output dirs to their sizes."""
+        sizes = {}
+        output_dirs = {os.path.dirname(v['output_path']) or '.' for v in self.manifest['videos']}
+        for output_dir in output_dirs:
+            try:
+                with os.scandir(output_dir) as it:
+                    for entry in it:
+                        if entry.name.endswith(('.txt', '.json')) and entry.is_file():
+                            sizes[os.path.join(output_dir, entry.name)] = entry.stat().st_size
+            except OSError:
+                continue
+        return sizes
+    
+    def _refresh_existing_outputs(self, video):
+        """Re-stat a video's transcript files after it has been processed."""
+        for path in (f"{video['output_path']}.txt", f"{video['output_path']}.json"):
+            try:
+                self._existing_sizes[path] = os.stat(path).st_size
+            except OSError:
+                self._existing_sizes.pop(path, None)
     
     def check_existing_transcript(self, video):
         """Check if transcript already exists and is valid."""
-        txt_path = Path(f"{video['output_path']}.txt")
-        json_path = Path(f"{video['output_path']}.json")
+        txt_size = self._existing_sizes.get(f"{video['output_path']}.txt", 0)
+        json_size = self._existing_sizes.get(f"{video['output_path']}.json", 0)
         
-        if txt_path.exists() and json_path.exists():
-            # Check file sizes to ensure they're not empty
-            if txt_path.stat().st_size > 100 and json_path.stat().st_size > 100:
-                return True
-        return False
+        # Check file sizes to ensure they're not empty
+        return txt_size > 100 and json_size > 100
+    
+    def _check_breaker(self):
+        """Raise CircuitOpenError while the breaker is open; allow one probe after."""
+        if time.time() < self._breaker_until:
+            raise CircuitOpenError(f"Circuit open after {self._consec_fail} consecutive failures")
+        if self._breaker_until:
+            # Cool-down elapsed: the next request is a half-open probe
+            self._half_open = True
+    
+    def _record_breaker_success(self):
+        """Close the breaker after a successful request."""
+        self._consec_fail = 0
+        self._breaker_until = 0
+        self._half_open = False
+    
+    def _record_breaker_failure(self):
+        """Count a recoverable failure, opening the breaker when the threshold is hit."""
+        self._consec_fail += 1
+        if self._half_open or self._consec_fail >= BREAKER_FAILURE_THRESHOLD:
+            self._breaker_until = time.time() + BREAKER_OPEN_SECONDS
+            self._half_open = False
+            print(f"           ⛔ Circuit opened for {BREAKER_OPEN_SECONDS}s after {self._consec_fail} consecutive failures")
+    
+    def _wait_for_breaker(self):
+        """Sleep until the breaker allows a probe, or until a stop is requested."""
+        remaining = self._breaker_until - time.time()
+        if remaining > 0:
+            self._stop.wait(remaining)
+    
+    def _download(self, video):
+        """Download a video ahead of time (runs on the prefetch thread)."""
+        return self.transcriber.download(video['url'])
+    
+    def _prefetch_next(self, videos, start):
+        """Start downloading the first video from `start` on that still needs work."""
+        for video in videos[start:]:
+            video_id = f"week_{video['week']}_class_{video['lesson']}"
+            if (video_id in self.completed or video_id in self.permanent_failed
+                    or self.failed.get(video_id, 0) >= 3 or self.check_existing_transcript(video)):
+                continue
+            if video_id not in self._prefetched:
+                self._prefetched[video_id] = self._prefetch_pool.submit(self._download, video)
+            return
+    
+    def _take_prefetched(self, video_id):
+        """Return the local path of a prefetched download, or None to download inline."""
+        future = self._prefetched.pop(video_id, None)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception:
+            # Download again inline so the error goes through the normal retry path
+            return None
+    
+    def _discard_prefetched(self):
+        """Drop downloads that were started but never transcribed, without waiting on them."""
+        for future in self._prefetched.values():
+            if not future.cancel():
+                # Already running (or finished): delete the file whenever it lands
+                future.add_done_callback(_remove_prefetched_file)
+        self._prefetched.clear()
+        self._prefetch_pool.shutdown(wait=False)
     
     def process_video(self, video, retry_count=0):
-        """Process a single video with error handling."""
+        """Process a single video with error handling (None if stopped mid-retry)."""
         video_id = f"week_{video['week']}_class_{video['lesson']}"
         max_retries = 3
         
@@ -151,6 +473,9 @@ class RobustBatchRunner:
                 print(f"           ✅ Transcript already exists")
                 return True
             
+            # Fail fast while the origin is known to be unhealthy
+            self._check_breaker()
+            
             # Update status
             self.current_video = video_id
             self.update_status(video_id, "downloading")
@@ -164,42 +489,44 @@ class RobustBatchRunner:
                     'week': video['week'],
                     'lesson': video['lesson'],
                     'date': video['date']
-                }
+                },
+                local_path=self._take_prefetched(video_id)
             )
             
             # Verify output was created
+            self._refresh_existing_outputs(video)
             if not self.check_existing_transcript(video):
                 raise Exception("Transcript files were not created")
             
+            self._record_breaker_success()
             print(f"           ✅ Completed in {result['processing_time']:.1f}s")
             print(f"           📝 {result['segments_count']} segments")
             
             return True
             
+        except CircuitOpenError:
+            raise
         except Exception as e:
             error_msg = str(e)
             
             # Check if it's a recoverable error
-            recoverable_errors = [
-                "timed out",
-                "connection",
-                "temporary",
-                "500",
-                "502",
-                "503",
-                "504"
-            ]
-            
-            is_recoverable = any(err in error_msg.lower() for err in recoverable_errors)
+            error_class = classify_error(e)
+            if issubclass(error_class, RecoverableError):
+                self._record_breaker_failure()
             
-            if is_recoverable and retry_count < max_retries:
-                wait_time = 30 * (retry_count + 1)  # Exponential backoff
-                print(f"           ⚠️  Recoverable error: {error_msg}")
-                print(f"           🔄 Retrying in {wait_time} seconds... (attempt {retry_count + 1}/{max_retries})")
-                time.sleep(wait_time)
+            if issubclass(error_class, RecoverableError) and retry_count < max_retries:
+                wait_time = retry_delay(error_class, retry_count)
+                label = "Rate limited" if issubclass(error_class, RateLimitedError) else "Recoverable error"
+                print(f"           ⚠️  {label}: {error_msg}")
+                print(f"           🔄 Retrying in {wait_time:.0f} seconds... (attempt {retry_count + 1}/{max_retries})")
+                if self._stop.wait(wait_time):
+                    return None  # Stop requested during backoff; leave the video unrecorded
                 return self.process_video(video, retry_count + 1)
             else:
                 print(f"           ❌ Failed after {retry_count + 1} attempts: {error_msg}")
+                if is_permanent_failure(e):
+                    # Bad URL or missing object; don't download it again on later runs
+                    self.permanent_failed.add(video_id)
                 self.save_error_log(video_id, e)
                 return False
     
@@ -210,14 +537,18 @@ class RobustBatchRunner:
         
         print(f"\n📚 Processing {total} videos from Cohort 3")
         print(f"⏭️  Skipping {len(self.completed)} already completed")
-        print(f"🔄 Retrying {len(self.failed)} previously failed")
+        print(f"🔄 Retrying {len(self.failed) - len(self.permanent_failed)} previously failed")
         print("\n" + "=" * 70 + "\n")
         
+        # Fold anything replayed from a crashed run into the snapshot up front
+        if self._journal_entries:
+            self.save_checkpoint()
+        
         processed_count = 0
         failed_count = 0
         
         for i, video in enumerate(videos, 1):
-            if self.stop_requested:
+            if self._stop.is_set():
                 print("\n⚠️  Batch processing stopped by user")
                 break
             
@@ -228,6 +559,11 @@ class RobustBatchRunner:
                 print(f"[{i}/{total}] ⏭️  Skipping {video_id} (already done)")
                 continue
             
+            # Skip videos whose source is known to be broken
+            if video_id in self.permanent_failed:
+                print(f"[{i}/{total}] 🚫 Skipping {video_id} (source permanently unavailable)")
+                continue
+            
             # Check retry limit for failed videos
             if video_id in self.failed and self.failed[video_id] >= 3:
                 print(f"[{i}/{total}] ⚠️  Skipping {video_id} (max retries exceeded)")
@@ -236,14 +572,40 @@ class RobustBatchRunner:
             print(f"[{i}/{total}] 🎥 Processing {video_id}")
             print(f"           Date: {video['date']}")
             
-            # Process video
-            success = self.process_video(video)
+            # Overlap the next download with this video's transcription
+            self._prefetch_next(videos, i)
+            
+            # Process video, pausing while the circuit breaker is open
+            success = None
+            breaker_trips = 0
+            while success is None and not self._stop.is_set():
+                try:
+                    success = self.process_video(video)
+                except CircuitOpenError as e:
+                    breaker_trips += 1
+                    if breaker_trips > BREAKER_MAX_PROBES:
+                        # Sustained outage: record the failure instead of waiting forever
+                        print(f"           ❌ {e}; giving up after {BREAKER_MAX_PROBES} failed probes")
+                        self.save_error_log(video_id, e)
+                        success = False
+                        break
+                    wait_time = self._breaker_until - time.time()
+                    print(f"           ⛔ {e}; pausing {wait_time:.0f}s before probing again")
+                    self.update_status(video_id, "circuit_open")
+                    if self._journal_entries:
+                        self.save_checkpoint()
+                    self._wait_for_breaker()
+            
+            if success is None:
+                print("\n⚠️  Batch processing stopped by user")
+                break
             
             if success:
                 self.completed.add(video_id)
                 # Remove from failed if it was there
                 if video_id in self.failed:
                     del self.failed[video_id]
+                self.permanent_failed.discard(video_id)
                 processed_count += 1
             else:
                 # Track failures
@@ -252,15 +614,17 @@ class RobustBatchRunner:
                 self.failed[video_id] += 1
                 failed_count += 1
             
-            # Save checkpoint after each video
-            self.save_checkpoint()
+            # Record the result after each video
+            self.record_result(video_id, success)
             self.update_status(None, "waiting")
             
             print()
             
-            # Brief pause between videos
-            if i < total and not self.stop_requested:
-                time.sleep(2)
+            if breaker_trips > BREAKER_MAX_PROBES:
+                print("⛔ Origin still failing; stopping the run (re-run to resume from checkpoint)")
+                break
+        
+        self._discard_prefetched()
         
         # Final summary
         print("\n" + "=" * 70)
@@ -276,7 +640,7 @@ class RobustBatchRunner:
                 print(f"   - {vid_id} (failed {retry_count} times)")
             if len(self.failed) > 5:
                 print(f"   ... and {len(self.failed) - 5} more")
-            print("\nCheck logs/transcription_errors.json for details")
+            print("\nCheck logs/transcription_errors.jsonl for details")
             print("Re-run this script to retry failed videos")
         
         if len(self.completed) == total:
@@ -291,6 +655,7 @@ class RobustBatchRunner:
         # Final checkpoint save
         self.save_checkpoint()
         self.update_status(None, "completed")
+        self._flush_status()
 
 def main():
     """Main entry point."""
@@ -8,12 +8,49 @@ import os
 import json
 import time
 import logging
+import queue
+import threading
+import multiprocessing
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from faster_whisper import WhisperModel
+from typing import Dict, Iterable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import ctranslate2
+from faster_whisper import WhisperModel, decode_audio
+from faster_whisper.vad import VadOptions, get_speech_timestamps
 import hashlib
 
+try:
+    # Batched VAD-chunk inference, available in faster-whisper >= 1.1
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:
+    BatchedInferencePipeline = None
+
+try:
+    # Multithreaded SIMD hashing; MD5 is used when blake3 isn't installed
+    from blake3 import blake3
+    HASH_ALGORITHM = "blake3"
+except ImportError:
+    blake3 = None
+    HASH_ALGORITHM = "md5"
+
+# Extensions (without the dot) picked up when scanning cohort week folders
+VIDEO_EXT = frozenset({'mp4', 'webm', 'avi', 'mov', 'mkv'})
+
+# Silero VAD settings shared by the pre-pass and the built-in vad_filter
+VAD_PARAMETERS = dict(min_silence_duration_ms=500)
+SAMPLING_RATE = 16000
+# Decoded lectures held in memory at once by the threaded path
+AUDIO_BUFFERS = 2
+
+# Longest clip the batched pipeline decodes as one window (its chunk_length)
+BATCH_CHUNK_SECONDS = 30
+
+# File hashes from earlier runs, kept in the package's logs/ regardless of the CWD
+HASH_CACHE_PATH = Path(__file__).resolve().parent.parent / "logs" / "file_hash_cache.json"
+
+# Characters reserved in the transcript header for the segment count
+SEGMENT_COUNT_WIDTH = 10
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -25,28 +62,64 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _pack_speech_windows(chunks: List[Dict[str, int]]) -> List[Dict[str, float]]:
+    """Group consecutive VAD regions (sample offsets) into clips of at most
+    BATCH_CHUNK_SECONDS, returned in seconds as the batched pipeline expects."""
+    limit = BATCH_CHUNK_SECONDS * SAMPLING_RATE
+    clips = []
+    start, end = chunks[0]['start'], chunks[0]['end']
+    for chunk in chunks[1:]:
+        if chunk['end'] - start > limit:
+            clips.append({'start': start / SAMPLING_RATE, 'end': end / SAMPLING_RATE})
+            start = chunk['start']
+        end = chunk['end']
+    clips.append({'start': start / SAMPLING_RATE, 'end': end / SAMPLING_RATE})
+    return clips
+
 class BatchTranscriber:
     """Batch transcription system for cohort recordings."""
     
     def __init__(self, 
                  model_size: str = "base",
-                 device: str = "cpu",
-                 compute_type: str = "int8",
-                 max_workers: int = 2):
+                 device: Optional[str] = None,
+                 compute_type: Optional[str] = None,
+                 max_workers: int = 2,
+                 batch_size: int = 16,
+                 decode_workers: Optional[int] = None,
+                 processes: int = 1,
+                 device_index: int = 0):
         """
         Initialize the batch transcriber.
         
         Args:
             model_size: Whisper model size (tiny, base, small, medium, large)
-            device: Processing device (cpu, cuda)
-            compute_type: Computation type for optimization
+            device: Processing device (cpu, cuda); detected from CTranslate2 if None
+            compute_type: Computation type (defaults to int8_float16 on cuda, int8 on cpu)
             max_workers: Maximum parallel transcription workers
+            batch_size: Speech chunks decoded per forward pass in batched mode
+            decode_workers: Audio decoding threads feeding the model (defaults to max_workers)
+            processes: Worker processes with their own model (one per GPU on cuda)
+            device_index: GPU the model is loaded on when device is cuda
         """
+        if device is None:
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        if compute_type is None:
+            # INT8 weights with float16 activations on GPU; plain INT8 on CPU
+            compute_type = "int8_float16" if device == "cuda" else "int8"
+        
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
         self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.decode_workers = decode_workers or max_workers
+        self.processes = processes
+        self.device_index = device_index
         self.model = None
+        self.pipeline = None
+        self.hash_cache_path = HASH_CACHE_PATH
+        self._hash_cache = self._load_hash_cache()
+        self._new_hashes = {}  # Computed this run, not yet saved
         self.stats = {
             'total_processed': 0,
             'total_duration': 0,
@@ -58,30 +131,127 @@ class BatchTranscriber:
         """Load the Whisper model with optimizations."""
         try:
             logger.info(f"Loading Whisper model: {self.model_size}")
-            self.model = WhisperModel(
-                self.model_size,
-                device=self.device,
-                compute_type=self.compute_type,
-                cpu_threads=0,  # Use all available CPU threads
-                num_workers=1   # Single worker per model instance
-            )
+            if self.device == "cuda":
+                # CPU thread settings don't affect GPU inference
+                self.model = WhisperModel(
+                    self.model_size,
+                    device=self.device,
+                    device_index=self.device_index,
+                    compute_type=self.compute_type
+                )
+            else:
+                # cpu_threads=0 lets CTranslate2 take every core, which oversubscribes
+                # shared boxes
+                self.model = WhisperModel(
+                    self.model_size,
+                    device=self.device,
+                    compute_type=self.compute_type,
+                    cpu_threads=max(1, (os.cpu_count() or 2) // 2),
+                    num_workers=2   # Overlap encoder and decoder work
+                )
+            if BatchedInferencePipeline is not None:
+                self.pipeline = BatchedInferencePipeline(model=self.model)
+            else:
+                logger.warning("BatchedInferencePipeline unavailable; using sequential decoding")
             logger.info("✅ Model loaded successfully!")
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
             raise
     
+    def detect_speech(self, audio) -> Optional[List[float]]:
+        """
+        Run Silero VAD over decoded audio ahead of transcription.
+        
+        Args:
+            audio: 16 kHz float32 samples
+            
+        Returns:
+            clip_timestamps for the active decoder, or None if no speech was found:
+            {'start', 'end'} dicts in seconds for the batched pipeline, otherwise a
+            flat [start, end, start, end, ...] list in seconds
+        """
+        if self.pipeline is not None:
+            # As in the pipeline's own vad_filter pass, no speech region may outgrow
+            # one window; anything past 30 s in a clip would be dropped
+            vad_options = VadOptions(**VAD_PARAMETERS, max_speech_duration_s=BATCH_CHUNK_SECONDS)
+        else:
+            vad_options = VadOptions(**VAD_PARAMETERS)
+        chunks = get_speech_timestamps(audio, vad_options)
+        if not chunks:
+            return None
+        
+        if self.pipeline is not None:
+            return _pack_speech_windows(chunks)
+        
+        clips = []
+        for chunk in chunks:
+            clips.append(chunk['start'] / SAMPLING_RATE)
+            clips.append(chunk['end'] / SAMPLING_RATE)
+        return clips
+    
+    def _load_hash_cache(self) -> Dict[str, str]:
+        """Load previously computed file hashes keyed by path, size and mtime."""
+        try:
+            with open(self.hash_cache_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            # Missing, unreadable or corrupt: start over and rebuild it this run
+            if not isinstance(e, FileNotFoundError):
+                logger.warning(f"Ignoring hash cache {self.hash_cache_path}: {e}")
+            return {}
+    
     def get_file_hash(self, file_path: str) -> str:
-        """Generate MD5 hash of file for integrity checking."""
-        hash_md5 = hashlib.md5()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+        """Generate a BLAKE3 (or MD5 fallback) hash of file for integrity checking."""
+        # Unchanged files reuse the hash from a previous run
+        st = os.stat(file_path)
+        cache_key = f"{HASH_ALGORITHM}:{file_path}:{st.st_size}:{st.st_mtime_ns}"
+        if cache_key in self._hash_cache:
+            return self._hash_cache[cache_key]
+        
+        if blake3 is not None:
+            hasher = blake3(max_threads=blake3.AUTO)
+            hasher.update_mmap(file_path)
+            digest = hasher.hexdigest()
+        else:
+            with open(file_path, "rb", buffering=0) as f:
+                if hasattr(os, "posix_fadvise"):
+                    # Sequential hint lets the kernel read ahead more aggressively
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                    digest = hashlib.file_digest(f, "md5").hexdigest()
+                else:
+                    hash_md5 = hashlib.md5()
+                    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                        hash_md5.update(chunk)
+                    digest = hash_md5.hexdigest()
+        
+        self._hash_cache[cache_key] = digest
+        self._new_hashes[cache_key] = digest
+        return digest
+    
+    def save_hash_cache(self):
+        """Merge this run's new hashes into the on-disk cache and replace it atomically."""
+        if not self._new_hashes:
+            return
+        
+        # Re-read so entries saved by other runs since we loaded aren't clobbered
+        merged = self._load_hash_cache()
+        merged.update(self._new_hashes)
+        tmp_path = self.hash_cache_path.with_name(f"{self.hash_cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(merged, f)
+            os.replace(tmp_path, self.hash_cache_path)
+            self._new_hashes.clear()
+        except OSError as e:
+            logger.warning(f"Could not save hash cache: {e}")
     
     def transcribe_single_file(self, 
                               video_path: str, 
                               output_path: str = None,
-                              metadata: Dict = None) -> Dict:
+                              metadata: Dict = None,
+                              audio=None,
+                              clip_timestamps: Optional[List[float]] = None) -> Dict:
         """
         Transcribe a single video file.
         
@@ -89,6 +259,8 @@ class BatchTranscriber:
             video_path: Path to video file
             output_path: Output path for transcript (auto-generated if None)
             metadata: Additional metadata to include
+            audio: Pre-decoded 16 kHz float32 samples (decoded from video_path if None)
+            clip_timestamps: Speech regions from detect_speech(); skips the built-in VAD
             
         Returns:
             Dict with transcription results and metadata
@@ -108,18 +280,48 @@ class BatchTranscriber:
         start_time = time.time()
         
         try:
-            # Transcribe with optimizations
-            segments, info = self.model.transcribe(
-                str(video_path),
-                beam_size=1,  # Faster beam search
-                language="en",  # Assuming English
-                condition_on_previous_text=False,  # Faster processing
-                vad_filter=True,  # Voice activity detection
-                vad_parameters=dict(min_silence_duration_ms=500)
-            )
+            source = audio if audio is not None else str(video_path)
             
-            # Collect all segments
-            segment_list = list(segments)
+            # Transcribe with optimizations
+            if self.pipeline is not None and clip_timestamps:
+                # VAD already ran in the decoder thread; decode its chunks batch_size at a time
+                segments, info = self.pipeline.transcribe(
+                    source,
+                    batch_size=self.batch_size,
+                    beam_size=1,
+                    language="en",
+                    vad_filter=False,
+                    clip_timestamps=clip_timestamps
+                )
+            elif self.pipeline is not None:
+                # VAD-segmented chunks are decoded batch_size at a time
+                segments, info = self.pipeline.transcribe(
+                    source,
+                    batch_size=self.batch_size,
+                    beam_size=1,
+                    language="en",
+                    vad_filter=True,
+                    vad_parameters=VAD_PARAMETERS
+                )
+            elif clip_timestamps:
+                # VAD already ran in the decoder thread; only decode speech regions
+                segments, info = self.model.transcribe(
+                    source,
+                    beam_size=1,
+                    language="en",
+                    condition_on_previous_text=False,
+                    vad_filter=False,
+                    clip_timestamps=clip_timestamps
+                )
+            else:
+                segments, info = self.model.transcribe(
+                    source,
+                    beam_size=1,  # Faster beam search
+                    language="en",  # Assuming English
+                    condition_on_previous_text=False,  # Faster processing
+                    vad_filter=True,  # Voice activity detection
+                    vad_parameters=VAD_PARAMETERS
+                )
             
             # Generate file hash for integrity
             file_hash = self.get_file_hash(str(video_path))
@@ -129,19 +331,20 @@ class BatchTranscriber:
                 'source_file': str(video_path),
                 'output_file': str(output_path),
                 'file_hash': file_hash,
+                'hash_algorithm': HASH_ALGORITHM,
                 'file_size': video_path.stat().st_size,
                 'language': info.language,
                 'language_probability': float(info.language_probability),
                 'duration_seconds': float(info.duration),
                 'model_used': self.model_size,
-                'segment_count': len(segment_list),
+                'segment_count': 0,  # Filled in once segments are written
                 'transcription_timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
                 'processing_time_seconds': 0,  # Will be updated
                 'custom_metadata': metadata or {}
             }
             
-            # Write transcript file
-            self._write_transcript_file(segment_list, output_path, transcript_metadata)
+            # Write transcript file while the model is still producing segments
+            segment_count = self._write_transcript_file(segments, output_path, transcript_metadata)
             
             # Update processing time
             processing_time = time.time() - start_time
@@ -157,7 +360,7 @@ class BatchTranscriber:
             return {
                 'success': True,
                 'metadata': transcript_metadata,
-                'segments': len(segment_list)
+                'segments': segment_count
             }
             
         except Exception as e:
@@ -171,39 +374,81 @@ class BatchTranscriber:
                 'file': str(video_path)
             }
     
-    def _write_transcript_file(self, segments: List, output_path: Path, metadata: Dict):
-        """Write transcript to file with metadata and formatting."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            # Write header with metadata
-            f.write("# Video Transcription\n\n")
-            f.write(f"**Source File:** {metadata['source_file']}\n")
-            f.write(f"**Duration:** {metadata['duration_seconds']:.2f} seconds\n")
-            f.write(f"**Language:** {metadata['language']} (confidence: {metadata['language_probability']:.2f})\n")
-            f.write(f"**Model:** {metadata['model_used']}\n")
-            f.write(f"**Segments:** {metadata['segment_count']}\n")
-            f.write(f"**Generated:** {metadata['transcription_timestamp']}\n")
-            f.write(f"**File Hash:** {metadata['file_hash']}\n\n")
+    def _write_transcript_file(self, segments: Iterable, output_path: Path, metadata: Dict) -> int:
+        """Stream segments to the transcript file as they are decoded.
+        
+        Args:
+            segments: Segment iterator (typically the faster-whisper generator)
+            output_path: Transcript path; the JSON sidecar is written next to it
+            metadata: Transcript metadata; ``segment_count`` is updated in place
+            
+        Returns:
+            Number of segments written
+        """
+        # Header with metadata, up to the segment count which is patched afterwards
+        head = [
+            "# Video Transcription\n\n",
+            f"**Source File:** {metadata['source_file']}\n",
+            f"**Duration:** {metadata['duration_seconds']:.2f} seconds\n",
+            f"**Language:** {metadata['language']} (confidence: {metadata['language_probability']:.2f})\n",
+            f"**Model:** {metadata['model_used']}\n",
+            "**Segments:** ",
+        ]
+        tail = [
+            "\n",
+            f"**Generated:** {metadata['transcription_timestamp']}\n",
+            f"**File Hash:** {metadata['file_hash']} ({metadata['hash_algorithm']})\n\n",
+        ]
+        
+        # Add custom metadata if present
+        if metadata['custom_metadata']:
+            tail.append("## Additional Metadata\n")
+            tail.extend(f"**{key}:** {value}\n" for key, value in metadata['custom_metadata'].items())
+            tail.append("\n")
+        
+        tail.append("---\n\n")
+        tail.append("## Transcript\n\n")
+        
+        # Both files are written beside their targets and renamed at the end, so a
+        # failure mid-transcription never leaves a partial transcript that looks finished
+        json_path = output_path.with_suffix('.json')
+        txt_tmp = output_path.with_name(output_path.name + ".tmp")
+        json_tmp = json_path.with_name(json_path.name + ".tmp")
+        
+        try:
+            # The 1 MiB buffer keeps per-segment writes from turning into syscalls
+            segment_count = 0
+            with open(txt_tmp, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write("".join(head))
+                count_offset = f.tell()
+                f.write(" " * SEGMENT_COUNT_WIDTH)
+                f.write("".join(tail))
+                
+                # Timestamped segments, written as the decoder yields them
+                for segment in segments:
+                    f.write(f"**[{segment.start:.2f}s → {segment.end:.2f}s]** {segment.text.strip()}\n\n")
+                    segment_count += 1
+                
+                # Fill in the fixed-width placeholder now that the count is known
+                f.seek(count_offset)
+                f.write(f"{segment_count:<{SEGMENT_COUNT_WIDTH}}")
             
-            # Add custom metadata if present
-            if metadata['custom_metadata']:
-                f.write("## Additional Metadata\n")
-                for key, value in metadata['custom_metadata'].items():
-                    f.write(f"**{key}:** {value}\n")
-                f.write("\n")
+            metadata['segment_count'] = segment_count
             
-            f.write("---\n\n")
-            f.write("## Transcript\n\n")
+            # Also save metadata as JSON for programmatic access
+            with open(json_tmp, 'w') as f:
+                json.dump(metadata, f, indent=2)
             
-            # Write timestamped segments
-            for segment in segments:
-                timestamp = f"[{segment.start:.2f}s → {segment.end:.2f}s]"
-                text = segment.text.strip()
-                f.write(f"**{timestamp}** {text}\n\n")
+            # Transcript last: once it exists, its sidecar does too
+            os.replace(json_tmp, json_path)
+            os.replace(txt_tmp, output_path)
+        except BaseException:
+            for tmp_path in (txt_tmp, json_tmp):
+                if tmp_path.exists():
+                    tmp_path.unlink()
+            raise
         
-        # Also save metadata as JSON for programmatic access
-        json_path = output_path.with_suffix('.json')
-        with open(json_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        return segment_count
     
     def transcribe_cohort_batch(self, cohort_path: str) -> Dict:
         """
@@ -216,46 +461,28 @@ class BatchTranscriber:
             Dict with batch processing results
         """
         cohort_path = Path(cohort_path)
-        video_extensions = {'.mp4', '.webm', '.avi', '.mov', '.mkv'}
         
-        # Find all video files
+        # Find all video files (scandir reuses directory entry types, no extra stats)
         video_files = []
-        for week_dir in cohort_path.iterdir():
-            if week_dir.is_dir() and week_dir.name.startswith('week_'):
-                for file_path in week_dir.iterdir():
-                    if file_path.suffix.lower() in video_extensions:
-                        video_files.append(file_path)
+        with os.scandir(cohort_path) as weeks:
+            for week in weeks:
+                if week.is_dir(follow_symlinks=False) and week.name.startswith('week_'):
+                    with os.scandir(week.path) as entries:
+                        for entry in entries:
+                            name = entry.name
+                            dot = name.rfind('.')
+                            if dot > 0 and name[dot + 1:].lower() in VIDEO_EXT:
+                                video_files.append(Path(entry.path))
         
         logger.info(f"Found {len(video_files)} video files in {cohort_path.name}")
         
-        results = []
+        if self.processes > 1:
+            results = self._transcribe_in_processes(video_files, cohort_path.name)
+        else:
+            results = self._transcribe_in_threads(video_files, cohort_path.name)
         
-        # Process files with limited parallelism
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all jobs
-            future_to_file = {
-                executor.submit(
-                    self.transcribe_single_file,
-                    str(video_file),
-                    None,
-                    {'cohort': cohort_path.name, 'week': video_file.parent.name}
-                ): video_file for video_file in video_files
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_file):
-                video_file = future_to_file[future]
-                try:
-                    result = future.result()
-                    result['file'] = str(video_file)
-                    results.append(result)
-                except Exception as e:
-                    logger.error(f"Exception processing {video_file}: {e}")
-                    results.append({
-                        'success': False,
-                        'error': str(e),
-                        'file': str(video_file)
-                    })
+        # One cache write per batch rather than per file
+        self.save_hash_cache()
         
         # Generate batch summary
         successful = [r for r in results if r['success']]
@@ -277,6 +504,124 @@ class BatchTranscriber:
             'results': results
         }
     
+    def _transcribe_in_threads(self, video_files: List[Path], cohort_name: str) -> List[Dict]:
+        """Transcribe with this process's model, decoding audio in background threads."""
+        # Load up front so decoder threads know which clip format detect_speech should return
+        if not self.model:
+            self.load_model()
+        
+        # Filled by input index so results come back in video_files order,
+        # whichever decoder finishes first
+        results = [None] * len(video_files)
+        
+        # Decoder threads turn videos into audio arrays while this thread runs
+        # the model, so ffmpeg work overlaps with inference
+        audio_queue = queue.Queue()
+        # Each item is a whole lecture of float32 samples (~230 MB per hour), so cap
+        # how many exist at once: the one being transcribed plus one ready behind it.
+        # The slot is taken before decoding, so extra decode_workers wait instead of
+        # holding finished arrays.
+        audio_slots = threading.Semaphore(AUDIO_BUFFERS)
+        
+        def decode(index, video_file):
+            audio_slots.acquire()
+            try:
+                audio = decode_audio(str(video_file), sampling_rate=SAMPLING_RATE)
+                # VAD runs here, off the model thread, for both the batched and sequential decoders
+                clips = self.detect_speech(audio)
+                audio_queue.put((index, video_file, audio, clips, None))
+            except Exception as e:
+                audio_queue.put((index, video_file, None, None, e))
+        
+        with ThreadPoolExecutor(max_workers=self.decode_workers) as decoders:
+            for index, video_file in enumerate(video_files):
+                decoders.submit(decode, index, video_file)
+            
+            for _ in range(len(video_files)):
+                index, video_file, audio, clips, error = audio_queue.get()
+                try:
+                    if error is not None:
+                        logger.error(f"Exception decoding {video_file}: {error}")
+                        results[index] = {
+                            'success': False,
+                            'error': str(error),
+                            'file': str(video_file)
+                        }
+                        continue
+                    
+                    result = self.transcribe_single_file(
+                        str(video_file),
+                        None,
+                        {'cohort': cohort_name, 'week': video_file.parent.name},
+                        audio=audio,
+                        clip_timestamps=clips
+                    )
+                    result['file'] = str(video_file)
+                    results[index] = result
+                except Exception as e:
+                    logger.error(f"Exception processing {video_file}: {e}")
+                    results[index] = {
+                        'success': False,
+                        'error': str(e),
+                        'file': str(video_file)
+                    }
+                finally:
+                    # Free this lecture's samples before another decode may start
+                    audio = None
+                    audio_slots.release()
+        
+        return results
+    
+    def _transcribe_in_processes(self, video_files: List[Path], cohort_name: str) -> List[Dict]:
+        """Fan videos out to worker processes that each load their own model."""
+        results = [None] * len(video_files)  # In video_files order
+        
+        # Each worker takes one device index as it starts up
+        ctx = multiprocessing.get_context('forkserver')
+        device_indices = ctx.Queue()
+        for index in range(self.processes):
+            device_indices.put(index)
+        
+        with ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=ctx,
+            initializer=_worker_init,
+            initargs=(self.model_size, self.device, self.compute_type, self.batch_size, device_indices)
+        ) as executor:
+            future_to_file = {
+                executor.submit(
+                    _worker_transcribe,
+                    str(video_file),
+                    {'cohort': cohort_name, 'week': video_file.parent.name}
+                ): (index, video_file)
+                for index, video_file in enumerate(video_files)
+            }
+            
+            for future in as_completed(future_to_file):
+                index, video_file = future_to_file[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Exception processing {video_file}: {e}")
+                    result = {'success': False, 'error': str(e)}
+                result['file'] = str(video_file)
+                results[index] = result
+                
+                # Workers never write the hash cache; this process saves their entries
+                new_hashes = result.pop('hash_entries', {})
+                self._hash_cache.update(new_hashes)
+                self._new_hashes.update(new_hashes)
+                
+                # Workers keep their own stats; fold them into this instance
+                if result['success']:
+                    self.stats['total_processed'] += 1
+                    self.stats['total_duration'] += result['metadata']['duration_seconds']
+                    self.stats['total_processing_time'] += result['metadata']['processing_time_seconds']
+                else:
+                    self.stats['failed_files'].append(str(video_file))
+        
+        return results
+    
     def transcribe_all_cohorts(self, cohorts_base_path: str = "../cohorts") -> Dict:
         """
         Transcribe all videos across all cohorts.
@@ -338,13 +683,38 @@ class BatchTranscriber:
             json.dump(results, f, indent=2, default=str)
         logger.info(f"Processing report saved: {output_path}")
 
+# Per-process transcriber used by ProcessPoolExecutor workers
+_WORKER_TRANSCRIBER = None
+
+def _worker_init(model_size: str, device: str, compute_type: str, batch_size: int, device_indices):
+    """Load a model once per worker process, pinned to its own GPU on cuda."""
+    global _WORKER_TRANSCRIBER
+    _WORKER_TRANSCRIBER = BatchTranscriber(
+        model_size=model_size,
+        device=device,
+        compute_type=compute_type,
+        max_workers=1,
+        batch_size=batch_size,
+        device_index=device_indices.get()
+    )
+    _WORKER_TRANSCRIBER.load_model()
+
+def _worker_transcribe(video_path: str, metadata: Dict) -> Dict:
+    """Transcribe one file with the worker's model (arguments are plain strings/dicts)."""
+    result = _WORKER_TRANSCRIBER.transcribe_single_file(video_path, None, metadata)
+    # Hand new hashes back to the parent instead of racing other workers on the cache file
+    result['hash_entries'] = _WORKER_TRANSCRIBER._new_hashes
+    _WORKER_TRANSCRIBER._new_hashes = {}
+    return result
+
 def main():
     """Main execution function."""
     # Initialize transcriber
+    # Device and compute type are picked automatically; one process per GPU
     transcriber = BatchTranscriber(
         model_size="base",  # Good balance of speed vs accuracy
-        device="cpu",      # Change to "cuda" if GPU available
-        max_workers=2      # Adjust based on system resources
+        max_workers=2,     # Adjust based on system resources
+        processes=max(1, ctranslate2.get_cuda_device_count())
     )
     
     try:
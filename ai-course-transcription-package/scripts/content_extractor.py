@@ -4,20 +4,106 @@ Content extraction system for analyzing transcripts and extracting
 core programming principles, instructions, and learning materials.
 """
 
+import bisect
 import json
+import mmap
 import re
 import os
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import logging
 from dataclasses import dataclass, asdict
-from collections import defaultdict
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    # Multi-pattern matcher; falls back to per-keyword substring checks
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Vectorised substring search, used by the "pandas" keyword backend
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # DFA multi-pattern scanner; falls back to the re alternation per segment
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Transcript header fields, matched against the raw (UTF-8) header bytes
+METADATA_PATTERNS = {
+    'source_file': re.compile(rb'\*\*Source File:\*\* (.+)'),
+    'duration': re.compile(rb'\*\*Duration:\*\* ([\d.]+) seconds'),
+    'language': re.compile(rb'\*\*Language:\*\* (\w+)'),
+    'model': re.compile(rb'\*\*Model:\*\* (\w+)'),
+    'segments': re.compile(rb'\*\*Segments:\*\* (\d+)'),
+    'file_hash': re.compile(rb'\*\*File Hash:\*\* ([a-f0-9]+)')
+}
+
+# Timestamped transcript lines: **[12.34s → 15.67s]** text
+SEGMENT_RE = re.compile(
+    rb'\*\*\[([\d.]+)s \xe2\x86\x92 ([\d.]+)s\]\*\* (.+?)(?=\n\n|\n\*\*\[|$)',
+    re.DOTALL
+)
+
+# Phrases that mark instructional content (matched case-insensitively)
+INSTRUCTION_PATTERNS = (
+    r"first|next|then|now|step \d+",  # Sequential indicators
+    r"let's|we're going to|we'll|we need to",  # Action indicators
+    r"here's how|this is how|the way to",  # Explanation indicators
+    r"notice that|observe|see how|look at",  # Observation indicators
+    r"remember|important|key point|crucial",  # Emphasis indicators
+    r"example|for instance|let me show you",  # Example indicators
+    r"exercise|practice|try this|homework",  # Practice indicators
+)
+
+# Indicator words for the difficulty and action classifiers, one bit per group
+ADVANCED, BEGINNER, EXPLANATION, DEMONSTRATION, EXERCISE, REVIEW = (1 << n for n in range(6))
+INDICATOR_GROUPS = (
+    (ADVANCED, ('complex', 'advanced', 'sophisticated', 'optimization')),
+    (BEGINNER, ('basic', 'simple', 'introduction', 'first', 'start')),
+    (EXPLANATION, ('explain', 'because', 'reason', 'why')),
+    (DEMONSTRATION, ('show', 'demonstrate', 'example')),
+    (EXERCISE, ('try', 'exercise', 'practice')),
+    (REVIEW, ('review', 'recap', 'summary')),
+)
+INDICATOR_BITS = {word: bit for bit, words in INDICATOR_GROUPS for word in words}
+INDICATOR_ITEMS = tuple(INDICATOR_BITS.items())
+ALL_INDICATORS = ADVANCED | BEGINNER | EXPLANATION | DEMONSTRATION | EXERCISE | REVIEW
+
+# Simple patterns for code detection
+CODE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'`([^`]+)`',  # Inline code
+    r'```[\s\S]*?```',  # Code blocks
+    r'\b\w+\([^)]*\)',  # Function calls
+    r'\b\w+\.\w+',  # Method calls
+))
+
+# Parsed transcripts kept per extractor, keyed by (path, mtime_ns, size)
+PARSE_CACHE_SIZE = 128
+
+# Metadata is only searched before this marker (or within HEADER_SCAN_BYTES)
+TRANSCRIPT_MARKER = b"## Transcript"
+HEADER_SCAN_BYTES = 4096
+
+# Slotted dataclasses (no per-instance __dict__) where supported (Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class LearningPrinciple:
     """Represents an extracted learning principle."""
     title: str
@@ -30,7 +116,7 @@ class LearningPrinciple:
     difficulty_level: str  # "beginner", "intermediate", "advanced"
     code_examples: List[str] = None
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class InstructionSegment:
     """Represents a step-by-step instruction segment."""
     step_number: int
@@ -58,10 +144,36 @@ class ClassSession:
 class ContentExtractor:
     """Extract structured learning content from transcripts."""
     
-    def __init__(self):
+    def __init__(self, keyword_backend: str = "auto"):
+        """
+        Initialize the content extractor.
+        
+        Args:
+            keyword_backend: How keywords are matched across segments: "automaton"
+                (pyahocorasick), "pandas" (vectorised per keyword), "python", or
+                "auto" to use the automaton when installed
+        """
+        if keyword_backend == "auto":
+            keyword_backend = "automaton" if ahocorasick is not None else "python"
+        if keyword_backend not in ("automaton", "pandas", "python"):
+            raise ValueError(f"Unknown keyword backend: {keyword_backend}")
+        if (keyword_backend == "automaton" and ahocorasick is None) or (keyword_backend == "pandas" and pd is None):
+            raise ImportError(f"Keyword backend '{keyword_backend}' is not installed")
+        self.keyword_backend = keyword_backend
+        
         self.programming_keywords = self._load_programming_keywords()
+        self._flat_keywords = [
+            (category, keyword)
+            for category, keywords in self.programming_keywords.items()
+            for keyword in keywords
+        ]
+        self._keyword_automaton = self._build_keyword_automaton() if keyword_backend == "automaton" else None
         self.instruction_patterns = self._compile_instruction_patterns()
+        self._instruction_database = self._build_instruction_database()
+        self._indicator_automaton = self._build_indicator_automaton()
+        self._scan_automaton = self._build_scan_automaton() if keyword_backend == "automaton" else None
         self.concept_categories = self._define_concept_categories()
+        self._parse_cache = OrderedDict()
     
     def _load_programming_keywords(self) -> Dict[str, List[str]]:
         """Load comprehensive programming keywords by category."""
@@ -94,18 +206,146 @@ class ContentExtractor:
             ]
         }
     
-    def _compile_instruction_patterns(self) -> List[re.Pattern]:
-        """Compile regex patterns to identify instructional content."""
-        patterns = [
-            r"(?i)(?:first|next|then|now|step \d+)",  # Sequential indicators
-            r"(?i)(?:let's|we're going to|we'll|we need to)",  # Action indicators
-            r"(?i)(?:here's how|this is how|the way to)",  # Explanation indicators
-            r"(?i)(?:notice that|observe|see how|look at)",  # Observation indicators
-            r"(?i)(?:remember|important|key point|crucial)",  # Emphasis indicators
-            r"(?i)(?:example|for instance|let me show you)",  # Example indicators
-            r"(?i)(?:exercise|practice|try this|homework)",  # Practice indicators
-        ]
-        return [re.compile(pattern) for pattern in patterns]
+    def _build_keyword_automaton(self):
+        """Build an Aho-Corasick automaton mapping keyword -> (order, category, keyword)."""
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        order = 0
+        for category, keywords in self.programming_keywords.items():
+            for keyword in keywords:
+                automaton.add_word(keyword, (order, category, keyword))
+                order += 1
+        automaton.make_automaton()
+        return automaton
+    
+    def _build_indicator_automaton(self):
+        """Build an Aho-Corasick automaton mapping indicator word -> group bit."""
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for word, bit in INDICATOR_BITS.items():
+            automaton.add_word(word, bit)
+        automaton.make_automaton()
+        return automaton
+    
+    def _build_scan_automaton(self):
+        """Build one automaton over keywords and indicator words for fused scans.
+        
+        Values are (keyword entry or None, indicator bit); a word such as 'try'
+        can be both a keyword and an indicator.
+        """
+        entries = {}
+        order = 0
+        for category, keywords in self.programming_keywords.items():
+            for keyword in keywords:
+                entries[keyword] = [(order, category, keyword), 0]
+                order += 1
+        for word, bit in INDICATOR_BITS.items():
+            entries.setdefault(word, [None, 0])[1] = bit
+        
+        automaton = ahocorasick.Automaton()
+        for word, (entry, bit) in entries.items():
+            automaton.add_word(word, (entry, bit))
+        automaton.make_automaton()
+        return automaton
+    
+    def _scan(self, text_lower: str) -> Tuple[List[Tuple[str, str]], int]:
+        """Keyword matches and indicator mask for a text, in a single pass when possible."""
+        if self._scan_automaton is None:
+            return self._match_keywords(text_lower), self._indicator_mask(text_lower)
+        
+        hits = set()
+        mask = 0
+        for _, (entry, bit) in self._scan_automaton.iter(text_lower):
+            if entry is not None:
+                hits.add(entry)
+            mask |= bit
+        return [(category, keyword) for _, category, keyword in sorted(hits)], mask
+    
+    def _indicator_mask(self, text_lower: str) -> int:
+        """OR together the group bits of every indicator word found in text."""
+        mask = 0
+        if self._indicator_automaton is not None:
+            for _, bit in self._indicator_automaton.iter(text_lower):
+                mask |= bit
+                if mask == ALL_INDICATORS:
+                    break
+        else:
+            # Substring checks beat tokenising + set intersection here (and keep
+            # matches like 'try' in 'entry'); words of already-set groups are skipped
+            for word, bit in INDICATOR_ITEMS:
+                if not mask & bit and word in text_lower:
+                    mask |= bit
+        return mask
+    
+    def _match_keywords(self, text_lower: str) -> List[Tuple[str, str]]:
+        """Return (category, keyword) pairs found in text, in keyword-definition order."""
+        if self._keyword_automaton is None:
+            return [(category, keyword) for category, keyword in self._flat_keywords if keyword in text_lower]
+        
+        # One pass over the text; repeated occurrences collapse to a single hit
+        hits = {value for _, value in self._keyword_automaton.iter(text_lower)}
+        return [(category, keyword) for _, category, keyword in sorted(hits)]
+    
+    def _match_keywords_batch(self, texts_lower: List[str]) -> List[List[Tuple[str, str]]]:
+        """Match keywords for many texts at once; one (category, keyword) list per text."""
+        if self.keyword_backend != "pandas" or not texts_lower:
+            return [self._match_keywords(text_lower) for text_lower in texts_lower]
+        
+        # One C-level scan of every text per keyword; keyword order is preserved
+        # because hits are appended keyword by keyword
+        series = pd.Series(texts_lower, dtype=object)
+        matches = [[] for _ in texts_lower]
+        for category, keyword in self._flat_keywords:
+            for index in series.str.contains(keyword, regex=False).to_numpy().nonzero()[0]:
+                matches[index].append((category, keyword))
+        return matches
+    
+    def _compile_instruction_patterns(self) -> re.Pattern:
+        """Compile one alternation regex that identifies instructional content."""
+        # A single search runs the whole alternation in C instead of 7 searches per segment
+        return re.compile("(?i)" + "|".join(f"(?:{pattern})" for pattern in INSTRUCTION_PATTERNS))
+    
+    def _build_instruction_database(self):
+        """Compile the instruction patterns into a Hyperscan database, if available."""
+        if hyperscan is None:
+            return None
+        
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern.encode('ascii') for pattern in INSTRUCTION_PATTERNS],
+            ids=list(range(len(INSTRUCTION_PATTERNS))),
+            elements=len(INSTRUCTION_PATTERNS),
+            flags=[hyperscan.HS_FLAG_CASELESS] * len(INSTRUCTION_PATTERNS)
+        )
+        return database
+    
+    def _find_instruction_segments(self, texts: List[str]) -> set:
+        """Return indices of texts containing instructional phrases."""
+        if self._instruction_database is None:
+            return {i for i, text in enumerate(texts) if self.instruction_patterns.search(text)}
+        
+        # Scan every segment in one pass; segments are newline-separated and no
+        # pattern can match across a newline
+        starts = []
+        offset = 0
+        encoded = []
+        for text in texts:
+            data = text.encode('utf-8')
+            starts.append(offset)
+            encoded.append(data)
+            offset += len(data) + 1
+        
+        found = set()
+        
+        def on_match(pattern_id, start, end, flags, context):
+            found.add(bisect.bisect_right(starts, end - 1) - 1)
+        
+        self._instruction_database.scan(b"\n".join(encoded), match_event_handler=on_match)
+        return found
     
     def _define_concept_categories(self) -> Dict[str, List[str]]:
         """Define how to categorize programming concepts."""
@@ -121,56 +361,73 @@ class ContentExtractor:
         }
     
     def parse_transcript_file(self, transcript_path: str) -> Dict:
-        """Parse a transcript file and extract structured content."""
-        transcript_path = Path(transcript_path)
-        
-        with open(transcript_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Extract metadata from header
-        metadata = self._extract_metadata_from_header(content)
-        
-        # Parse timestamped segments
-        segments = self._parse_timestamped_segments(content)
+        """Parse a transcript file and extract structured content (cached while unchanged)."""
+        path = os.path.abspath(transcript_path)
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+        
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            self._parse_cache.move_to_end(key)
+            return cached
+        
+        parsed = self._read_transcript(path)
+        self._parse_cache[key] = parsed
+        if len(self._parse_cache) > PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return parsed
+    
+    def invalidate_cache(self, transcript_path: Optional[str] = None):
+        """Drop cached parses for one transcript, or all of them."""
+        if transcript_path is None:
+            self._parse_cache.clear()
+            return
+        
+        path = os.path.abspath(transcript_path)
+        for key in [key for key in self._parse_cache if key[0] == path]:
+            del self._parse_cache[key]
+    
+    def _read_transcript(self, transcript_path: str) -> Dict:
+        """Read and parse a transcript file from disk."""
+        with open(transcript_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return {'metadata': {}, 'segments': []}
+            
+            # Regexes run over the mapped pages directly; no decoded copy of the file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                header_end = mm.find(TRANSCRIPT_MARKER, 0, HEADER_SCAN_BYTES)
+                header = mm[:header_end if header_end != -1 else HEADER_SCAN_BYTES]
+                
+                # Extract metadata from header
+                metadata = self._extract_metadata_from_header(header)
+                
+                # Parse timestamped segments
+                segments = self._parse_timestamped_segments(mm)
         
         return {
             'metadata': metadata,
-            'segments': segments,
-            'content': content
+            'segments': segments
         }
     
-    def _extract_metadata_from_header(self, content: str) -> Dict:
+    def _extract_metadata_from_header(self, header: bytes) -> Dict:
         """Extract metadata from transcript header."""
         metadata = {}
         
-        # Look for metadata patterns
-        patterns = {
-            'source_file': r'\*\*Source File:\*\* (.+)',
-            'duration': r'\*\*Duration:\*\* ([\d.]+) seconds',
-            'language': r'\*\*Language:\*\* (\w+)',
-            'model': r'\*\*Model:\*\* (\w+)',
-            'segments': r'\*\*Segments:\*\* (\d+)',
-            'file_hash': r'\*\*File Hash:\*\* ([a-f0-9]+)'
-        }
-        
-        for key, pattern in patterns.items():
-            match = re.search(pattern, content)
+        for key, pattern in METADATA_PATTERNS.items():
+            match = pattern.search(header)
             if match:
-                metadata[key] = match.group(1)
+                metadata[key] = match.group(1).decode('utf-8')
         
         return metadata
     
-    def _parse_timestamped_segments(self, content: str) -> List[Dict]:
-        """Parse timestamped segments from transcript."""
+    def _parse_timestamped_segments(self, content) -> List[Dict]:
+        """Parse timestamped segments from transcript bytes (or an mmap of them)."""
         segments = []
         
-        # Pattern to match timestamped segments
-        segment_pattern = r'\*\*\[([\d.]+)s → ([\d.]+)s\]\*\* (.+?)(?=\n\n|\n\*\*\[|$)'
-        
-        for match in re.finditer(segment_pattern, content, re.DOTALL):
+        for match in SEGMENT_RE.finditer(content):
             start_time = float(match.group(1))
             end_time = float(match.group(2))
-            text = match.group(3).strip()
+            text = match.group(3).decode('utf-8').strip()
             
             segments.append({
                 'start': start_time,
@@ -183,52 +440,89 @@ class ContentExtractor:
     
     def extract_learning_principles(self, segments: List[Dict]) -> List[LearningPrinciple]:
         """Extract learning principles from transcript segments."""
-        principles = []
-        
+        # Keyed by title: only the first principle per title is kept
+        principles = {}
+        
+        # All segment texts joined once; a context window is then a slice of this
+        # buffer (starts[i] is where segment i begins) rather than a fresh join
+        texts = [s['text'] for s in segments]
+        joined = " ".join(texts)
+        starts = []
+        offset = 0
+        for t in texts:
+            starts.append(offset)
+            offset += len(t) + 1
+        
+        # Keep segments that look like a substantial explanation
+        candidates = []
         for i, segment in enumerate(segments):
             text = segment['text'].lower()
+            if len(segment['text']) > 50 and any(
+                word in text for word in ['because', 'since', 'reason', 'why', 'how']
+            ):
+                candidates.append((i, text))
+        
+        # Check for programming concepts
+        keyword_matches = self._match_keywords_batch([text for _, text in candidates])
+        
+        for (i, text), matches in zip(candidates, keyword_matches):
+            # Skip keywords whose principle already exists before building anything
+            new_matches = [
+                (f"{keyword.title()} Concept", category, keyword)
+                for category, keyword in matches
+                if f"{keyword.title()} Concept" not in principles
+            ]
+            if not new_matches:
+                continue
+            segment = segments[i]
+            
+            # Look for explanatory context around the keyword (two segments either side)
+            last = min(len(segments), i+3) - 1
+            ctx_start = starts[max(0, i-2)]
+            ctx_end = starts[last] + len(texts[last])
+            if ctx_end - ctx_start > 300:
+                context = joined[ctx_start:ctx_start + 300] + "..."
+            else:
+                context = joined[ctx_start:ctx_end]
             
-            # Check for programming concepts
-            for category, keywords in self.programming_keywords.items():
-                for keyword in keywords:
-                    if keyword in text:
-                        # Look for explanatory context around the keyword
-                        context_segments = segments[max(0, i-2):min(len(segments), i+3)]
-                        context = " ".join([s['text'] for s in context_segments])
-                        
-                        # Determine if this is a substantial explanation
-                        if len(segment['text']) > 50 and any(
-                            word in text for word in ['because', 'since', 'reason', 'why', 'how']
-                        ):
-                            principle = LearningPrinciple(
-                                title=f"{keyword.title()} Concept",
-                                description=segment['text'][:200] + "..." if len(segment['text']) > 200 else segment['text'],
-                                category=category,
-                                keywords=[keyword],
-                                timestamp_start=segment['start'],
-                                timestamp_end=segment['end'],
-                                context=context[:300] + "..." if len(context) > 300 else context,
-                                difficulty_level=self._assess_difficulty(segment['text']),
-                                code_examples=self._extract_code_examples(segment['text'])
-                            )
-                            principles.append(principle)
-        
-        return self._deduplicate_principles(principles)
+            # Segment-level fields, computed once however many keywords matched
+            description = segment['text'][:200] + "..." if len(segment['text']) > 200 else segment['text']
+            difficulty = self._assess_difficulty(segment['text'], text)
+            code_examples = self._extract_code_examples(segment['text'])
+            
+            for title, category, keyword in new_matches:
+                principles[title] = LearningPrinciple(
+                    title=title,
+                    description=description,
+                    category=category,
+                    keywords=[keyword],
+                    timestamp_start=segment['start'],
+                    timestamp_end=segment['end'],
+                    context=context,
+                    difficulty_level=difficulty,
+                    code_examples=list(code_examples)
+                )
+        
+        return list(principles.values())
     
     def extract_instruction_segments(self, segments: List[Dict]) -> List[InstructionSegment]:
         """Extract step-by-step instruction segments."""
         instructions = []
         step_counter = 1
         
-        for segment in segments:
+        # Check which segments contain instructional content
+        instruction_indices = self._find_instruction_segments([s['text'] for s in segments])
+        
+        for i, segment in enumerate(segments):
             text = segment['text']
-            
-            # Check if segment contains instructional content
-            is_instruction = any(pattern.search(text) for pattern in self.instruction_patterns)
+            is_instruction = i in instruction_indices
             
             if is_instruction and len(text) > 30:
-                action_type = self._classify_action_type(text)
-                related_concepts = self._identify_related_concepts(text)
+                # Lower-case once and share it with the classifiers
+                text_lower = text.lower()
+                matches, mask = self._scan(text_lower)
+                action_type = self._classify_action_type(text, text_lower, mask)
+                related_concepts = self._identify_related_concepts(text, text_lower, matches)
                 
                 instruction = InstructionSegment(
                     step_number=step_counter,
@@ -245,79 +539,51 @@ class ContentExtractor:
         
         return instructions
     
-    def _assess_difficulty(self, text: str) -> str:
+    def _assess_difficulty(self, text: str, text_lower: str) -> str:
         """Assess the difficulty level of content."""
-        text_lower = text.lower()
+        mask = self._indicator_mask(text_lower)
         
-        beginner_indicators = ['basic', 'simple', 'introduction', 'first', 'start']
-        advanced_indicators = ['complex', 'advanced', 'sophisticated', 'optimization']
-        
-        if any(indicator in text_lower for indicator in advanced_indicators):
+        if mask & ADVANCED:
             return "advanced"
-        elif any(indicator in text_lower for indicator in beginner_indicators):
+        elif mask & BEGINNER:
             return "beginner"
         else:
             return "intermediate"
     
-    def _classify_action_type(self, text: str) -> str:
+    def _classify_action_type(self, text: str, text_lower: str, mask: Optional[int] = None) -> str:
         """Classify the type of instructional action."""
-        text_lower = text.lower()
+        if mask is None:
+            mask = self._indicator_mask(text_lower)
         
-        if any(word in text_lower for word in ['explain', 'because', 'reason', 'why']):
+        if mask & EXPLANATION:
             return "explanation"
-        elif any(word in text_lower for word in ['show', 'demonstrate', 'example']):
+        elif mask & DEMONSTRATION:
             return "demonstration"
-        elif any(word in text_lower for word in ['try', 'exercise', 'practice']):
+        elif mask & EXERCISE:
             return "exercise"
-        elif any(word in text_lower for word in ['review', 'recap', 'summary']):
+        elif mask & REVIEW:
             return "review"
         else:
             return "instruction"
     
-    def _identify_related_concepts(self, text: str) -> List[str]:
+    def _identify_related_concepts(self, text: str, text_lower: str,
+                                   matches: Optional[List[Tuple[str, str]]] = None) -> List[str]:
         """Identify programming concepts mentioned in text."""
-        concepts = []
-        text_lower = text.lower()
-        
-        for category, keywords in self.programming_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    concepts.append(keyword)
-        
+        if matches is None:
+            matches = self._match_keywords(text_lower)
+        concepts = [keyword for _, keyword in matches]
         return list(set(concepts))  # Remove duplicates
     
     def _extract_code_examples(self, text: str) -> List[str]:
         """Extract code-like content from text."""
-        # Simple patterns for code detection
-        code_patterns = [
-            r'`([^`]+)`',  # Inline code
-            r'```[\s\S]*?```',  # Code blocks
-            r'\b\w+\([^)]*\)',  # Function calls
-            r'\b\w+\.\w+',  # Method calls
-        ]
-        
         code_examples = []
-        for pattern in code_patterns:
-            matches = re.findall(pattern, text)
-            code_examples.extend(matches)
+        for pattern in CODE_PATTERNS:
+            code_examples.extend(pattern.findall(text))
         
         return code_examples
     
-    def _extract_code_snippets(self, text: str) -> List[str]:
-        """Extract code snippets from instructional text."""
-        return self._extract_code_examples(text)  # Same implementation for now
-    
-    def _deduplicate_principles(self, principles: List[LearningPrinciple]) -> List[LearningPrinciple]:
-        """Remove duplicate principles based on similarity."""
-        unique_principles = []
-        seen_titles = set()
-        
-        for principle in principles:
-            if principle.title not in seen_titles:
-                unique_principles.append(principle)
-                seen_titles.add(principle.title)
-        
-        return unique_principles
+    # Code snippets in instructions use the same extraction for now
+    _extract_code_snippets = _extract_code_examples
     
     def analyze_class_session(self, transcript_path: str) -> ClassSession:
         """Perform complete analysis of a class session transcript."""
@@ -329,9 +595,15 @@ class ContentExtractor:
         instructions = self.extract_instruction_segments(parsed['segments'])
         
         # Derive metadata from file path
-        path_parts = Path(transcript_path).parts
-        cohort = next((part for part in path_parts if 'cohort' in part), 'unknown')
-        week = next((part for part in path_parts if 'week' in part), 'unknown')
+        # Single pass; the first matching part wins for each
+        cohort = week = None
+        for part in Path(transcript_path).parts:
+            if cohort is None and 'cohort' in part:
+                cohort = part
+            if week is None and 'week' in part:
+                week = part
+        cohort = cohort or 'unknown'
+        week = week or 'unknown'
         
         # Generate summary
         key_topics = list(set([p.category for p in principles]))
@@ -358,11 +630,8 @@ class ContentExtractor:
         if not principles and not instructions:
             return "No significant content extracted."
         
-        concept_counts = defaultdict(int)
-        for principle in principles:
-            concept_counts[principle.category] += 1
-        
-        main_topics = sorted(concept_counts.items(), key=lambda x: x[1], reverse=True)[:3]
+        concept_counts = Counter(principle.category for principle in principles)
+        main_topics = concept_counts.most_common(3)
         topic_list = [f"{topic} ({count} concepts)" for topic, count in main_topics]
         
         summary = f"Session covered {len(principles)} key principles across {len(concept_counts)} categories. "
@@ -381,8 +650,9 @@ class ContentExtractor:
                 'duration': session.duration,
                 'summary': session.summary
             },
-            'learning_principles': [asdict(p) for p in session.principles],
-            'instruction_segments': [asdict(i) for i in session.instructions],
+            # orjson serialises the dataclasses natively; the stdlib needs asdict copies
+            'learning_principles': session.principles if orjson else [asdict(p) for p in session.principles],
+            'instruction_segments': session.instructions if orjson else [asdict(i) for i in session.instructions],
             'key_topics': session.key_topics,
             'difficulty_progression': session.difficulty_progression,
             'statistics': {
@@ -393,13 +663,36 @@ class ContentExtractor:
             }
         }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        if orjson:
+            Path(output_path).write_bytes(
+                orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS)
+            )
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
         
         logger.info(f"Analysis report saved: {output_path}")
 
+# One extractor per worker process, built by the pool initializer
+_WORKER_EXTRACTOR = None
+
+
+def _init_worker():
+    """Build the worker's ContentExtractor once, reusing compiled patterns across files."""
+    global _WORKER_EXTRACTOR
+    _WORKER_EXTRACTOR = ContentExtractor()
+
+
+def _analyze_one(transcript_path: str) -> Tuple[Optional[ClassSession], Optional[str]]:
+    """Analyze a single transcript in a worker process."""
+    try:
+        return _WORKER_EXTRACTOR.analyze_class_session(transcript_path), None
+    except Exception as e:
+        return None, str(e)
+
+
 def main():
-    """Test content extraction on existing transcripts."""
+    """Run content extraction over all existing transcripts."""
     extractor = ContentExtractor()
     
     # Find transcript files
@@ -410,23 +703,24 @@ def main():
         print("No transcript files found. Run batch transcription first.")
         return
     
-    # Analyze first transcript as test
-    test_file = transcript_files[0]
-    print(f"Analyzing: {test_file}")
+    print(f"Analyzing {len(transcript_files)} transcripts")
     
-    try:
-        session = extractor.analyze_class_session(str(test_file))
-        
-        # Save analysis
-        output_path = test_file.parent / f"{test_file.stem}_analysis.json"
-        extractor.save_analysis_report(session, str(output_path))
-        
-        print(f"✅ Analysis complete!")
-        print(f"📊 Found {len(session.principles)} principles, {len(session.instructions)} instructions")
-        print(f"🎯 Key topics: {', '.join(session.key_topics)}")
-        
-    except Exception as e:
-        print(f"❌ Error during analysis: {e}")
+    # Extraction is pure-Python regex work, so spread files across processes
+    with ProcessPoolExecutor(initializer=_init_worker) as executor:
+        results = executor.map(_analyze_one, map(str, transcript_files))
+        
+        for transcript_file, (session, error) in zip(transcript_files, results):
+            if error:
+                print(f"❌ Error analyzing {transcript_file}: {error}")
+                continue
+            
+            # Save analysis
+            output_path = transcript_file.parent / f"{transcript_file.stem}_analysis.json"
+            extractor.save_analysis_report(session, str(output_path))
+            
+            print(f"✅ {transcript_file.name}: {len(session.principles)} principles, "
+                  f"{len(session.instructions)} instructions")
+            print(f"🎯 Key topics: {', '.join(session.key_topics)}")
 
 if __name__ == "__main__":
     main()
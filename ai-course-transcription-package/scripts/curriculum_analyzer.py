@@ -5,21 +5,103 @@ from transcript analysis data.
 """
 
 import json
+import os
 import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from collections import Counter
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Single-pass keyword counting; falls back to one bytes.count per keyword
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Identify key topics through keyword analysis
+TOPIC_KEYWORDS = {
+    'rag': ['rag', 'retrieval', 'augmented', 'generation', 'vector', 'embedding'],
+    'langchain': ['langchain', 'chain', 'llm', 'model'],
+    'langsmith': ['langsmith', 'monitoring', 'trace', 'debug'],
+    'memory': ['memory', 'conversation', 'history', 'buffer'],
+    'agents': ['agent', 'autonomous', 'tool', 'action'],
+    'embeddings': ['embedding', 'vector', 'similarity', 'semantic'],
+    'databases': ['database', 'pinecone', 'chroma', 'vector'],
+    'apis': ['api', 'endpoint', 'request', 'response'],
+    'prompting': ['prompt', 'engineering', 'template', 'context']
+}
+
+# Keywords shared between topics (vector, embedding) are only counted once
+TOPIC_VOCABULARY = tuple(dict.fromkeys(
+    keyword for keywords in TOPIC_KEYWORDS.values() for keyword in keywords
+))
+# Transcripts are scanned as raw bytes; keywords are ASCII so bytes.lower() suffices
+TOPIC_NEEDLES = tuple((keyword, keyword.encode('ascii')) for keyword in TOPIC_VOCABULARY)
+
+TOPIC_MAP = {
+    'rag': 'Retrieval-Augmented Generation (RAG)',
+    'langchain': 'LangChain Framework Development',
+    'langsmith': 'LLM Application Monitoring',
+    'memory': 'Conversation Memory Management',
+    'agents': 'AI Agent Development',
+    'embeddings': 'Vector Embeddings & Similarity Search',
+    'databases': 'Vector Database Integration',
+    'prompting': 'Advanced Prompt Engineering'
+}
+
+# All tool names in one alternation, most frequently mentioned first
+TOOLS_RE = re.compile(
+    rb'python|openai|langchain|langsmith|gpt-[34]|claude|anthropic|'
+    rb'pinecone|chroma|weaviate|qdrant|jupyter|colab|vscode|'
+    rb'pip|conda|virtualenv|venv|git|github|docker'
+)
+
+# Shared by every session until practices and patterns are extracted from content
+DEFAULT_BEST_PRACTICES = (
+    "Use environment variables for API keys",
+    "Implement proper error handling",
+    "Monitor token usage and costs",
+    "Test with simple examples first",
+    "Use virtual environments for isolation"
+)
+
+DEFAULT_CODE_PATTERNS = (
+    "LLM initialization and configuration",
+    "Prompt template creation and usage",
+    "Chain composition and execution",
+    "Error handling and validation",
+    "Memory management implementation"
+)
+
+# Filenames look like "week_2_class_1_2024-05-27_transcript"
+FILENAME_RE = re.compile(r'week_(\d+)_class_(\d+)_(\d{4}-\d{2}-\d{2})')
+TRANSCRIPT_STEM_RE = re.compile(r'week_(\d+)_class_(\d+)_(\d{4}-\d{2}-\d{2})_transcript')
+DURATION_RE = re.compile(rb'\*\*Duration:\*\* ([\d.]+) seconds')
+
+# Both parsers accept the raw bytes of a report file
+_loads = orjson.loads if orjson else json.loads
+
+# Transcripts are scanned in line-aligned blocks of roughly this many bytes
+READ_BLOCK_BYTES = 1024 * 1024
+
 @dataclass
 class ClassSession:
     """Represents a complete class session analysis."""
     cohort: str
     week: str
+    week_number: str
     class_num: str
     date: str
     duration_minutes: float
@@ -27,8 +109,8 @@ class ClassSession:
     subtopics: List[str]
     key_concepts: List[str]
     tools_used: List[str]
-    best_practices: List[str]
-    code_patterns: List[str]
+    best_practices: Tuple[str, ...]
+    code_patterns: Tuple[str, ...]
     learning_objectives: List[str]
     prerequisites: List[str]
     mastery_project: str
@@ -36,101 +118,153 @@ class ClassSession:
 class CurriculumAnalyzer:
     """Analyzes transcripts and generates comprehensive curriculum materials."""
     
-    def __init__(self, cohorts_path: str = "../cohorts", reports_path: str = "../reports"):
+    def __init__(self, cohorts_path: str = "../cohorts", reports_path: str = "../reports",
+                 keyword_backend: str = "auto"):
+        if keyword_backend == "auto":
+            keyword_backend = "automaton" if ahocorasick is not None else "python"
+        if keyword_backend not in ("automaton", "python"):
+            raise ValueError(f"Unknown keyword backend: {keyword_backend}")
+        if keyword_backend == "automaton" and ahocorasick is None:
+            raise ImportError(f"Keyword backend '{keyword_backend}' is not installed")
+        self.keyword_backend = keyword_backend
+        
         self.cohorts_path = Path(cohorts_path)
         self.reports_path = Path(reports_path)
         self.transcript_cache = {}
         self.analysis_cache = {}
+        self._report_index = None
+        self._keyword_automaton = self._build_keyword_automaton() if keyword_backend == "automaton" else None
+    
+    def _build_keyword_automaton(self):
+        """Build an Aho-Corasick automaton over every topic keyword."""
+        automaton = ahocorasick.Automaton()
+        for keyword in TOPIC_VOCABULARY:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
     
     def extract_key_topics_from_transcript(self, transcript_path: Path) -> Dict:
         """Extract key topics and concepts from transcript content."""
-        with open(transcript_path, 'r') as f:
-            content = f.read()
-        
-        # Extract metadata
-        duration_match = re.search(r'\*\*Duration:\*\* ([\d.]+) seconds', content)
-        duration_minutes = float(duration_match.group(1)) / 60 if duration_match else 0
-        
-        # Extract content sections (this is a simplified version)
-        segments = re.findall(r'\*\*\[([\d.]+)s → ([\d.]+)s\]\*\* (.+)', content)
-        
-        # Identify key topics through keyword analysis
-        topic_keywords = {
-            'rag': ['rag', 'retrieval', 'augmented', 'generation', 'vector', 'embedding'],
-            'langchain': ['langchain', 'chain', 'llm', 'model'],
-            'langsmith': ['langsmith', 'monitoring', 'trace', 'debug'],
-            'memory': ['memory', 'conversation', 'history', 'buffer'],
-            'agents': ['agent', 'autonomous', 'tool', 'action'],
-            'embeddings': ['embedding', 'vector', 'similarity', 'semantic'],
-            'databases': ['database', 'pinecone', 'chroma', 'vector'],
-            'apis': ['api', 'endpoint', 'request', 'response'],
-            'prompting': ['prompt', 'engineering', 'template', 'context']
-        }
+        duration_minutes = None
+        segment_count = 0
+        keyword_counts = dict.fromkeys(TOPIC_VOCABULARY, 0)
+        tools_mentioned = {}  # ordered by first mention
+        
+        # Stream the file in large line-aligned blocks: peak memory stays bounded
+        # while the keyword counts and tool search still run as C-level scans
+        with open(transcript_path, 'rb') as f:
+            for lines in iter(lambda: f.readlines(READ_BLOCK_BYTES), []):
+                block = b''.join(lines)
+                
+                # Extract metadata
+                if duration_minutes is None:
+                    duration_match = DURATION_RE.search(block)
+                    if duration_match:
+                        duration_minutes = float(duration_match.group(1)) / 60
+                
+                # Only the number of segments is used; each one starts a "**[start → end]**" line
+                segment_count += sum(1 for line in lines if line.startswith(b'**['))
+                
+                block_lower = block.lower()
+                if self._keyword_automaton is not None:
+                    # latin-1 maps each byte to one code point, so ASCII keywords match as
+                    # they do in bytes. Some keywords overlap themselves ('template' in
+                    # "templatemplate"), so skip a hit that starts inside the previous hit
+                    # of the same keyword to count the way bytes.count does
+                    last_end = {}
+                    for end, keyword in self._keyword_automaton.iter(block_lower.decode('latin-1')):
+                        if end - len(keyword) >= last_end.get(keyword, -1):
+                            keyword_counts[keyword] += 1
+                            last_end[keyword] = end
+                else:
+                    for keyword, needle in TOPIC_NEEDLES:
+                        keyword_counts[keyword] += block_lower.count(needle)
+                
+                # Extract tools mentioned
+                tools_mentioned.update(dict.fromkeys(TOOLS_RE.findall(block_lower)))
         
         # Count occurrences of topic keywords
-        topic_scores = {}
-        content_lower = content.lower()
-        
-        for topic, keywords in topic_keywords.items():
-            score = sum(content_lower.count(keyword) for keyword in keywords)
+        topic_scores = Counter()
+        for topic, keywords in TOPIC_KEYWORDS.items():
+            score = sum(keyword_counts[keyword] for keyword in keywords)
             if score > 5:  # Threshold for significance
                 topic_scores[topic] = score
         
-        # Extract tools mentioned
-        tools_mentioned = []
-        tool_patterns = [
-            r'(openai|gpt-[34]|claude|anthropic)',
-            r'(langchain|langsmith)',
-            r'(pinecone|chroma|weaviate|qdrant)',
-            r'(python|jupyter|colab|vscode)',
-            r'(pip|conda|virtualenv|venv)',
-            r'(git|github|docker)'
-        ]
-        
-        for pattern in tool_patterns:
-            matches = re.findall(pattern, content_lower)
-            tools_mentioned.extend(matches)
-        
         return {
-            'duration_minutes': duration_minutes,
-            'main_topics': sorted(topic_scores.keys(), key=topic_scores.get, reverse=True),
+            'duration_minutes': duration_minutes or 0,
+            'main_topics': [topic for topic, _ in topic_scores.most_common()],
             'topic_scores': topic_scores,
-            'tools_mentioned': list(set(tools_mentioned)),
-            'segment_count': len(segments)
+            'tools_mentioned': [tool.decode('ascii') for tool in tools_mentioned],
+            'segment_count': segment_count
         }
     
+    def _build_report_index(self) -> Dict[str, Path]:
+        """Map each session identifier to its analysis report with a single directory scan."""
+        index = {}
+        try:
+            with os.scandir(self.reports_path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('analysis.json'):
+                        continue
+                    match = FILENAME_RE.search(entry.name)
+                    if match:
+                        week_num, class_num, date = match.groups()
+                        index.setdefault(f"week_{week_num}_class_{class_num}_{date}", Path(entry.path))
+        except FileNotFoundError:
+            pass
+        return index
+    
     def load_analysis_report(self, session_identifier: str) -> Dict:
-        """Load the detailed analysis report for a session."""
-        report_files = list(self.reports_path.glob(f"*{session_identifier}*analysis.json"))
+        """Load the detailed analysis report for a session (cached per identifier)."""
+        if session_identifier in self.analysis_cache:
+            return self.analysis_cache[session_identifier]
         
-        if not report_files:
+        if self._report_index is None:
+            self._report_index = self._build_report_index()
+        
+        report_file = self._report_index.get(session_identifier)
+        if report_file is None:
             logger.warning(f"No analysis report found for {session_identifier}")
-            return {}
+            report = {}
+        else:
+            with open(report_file, 'rb') as f:
+                report = _loads(f.read())
         
-        with open(report_files[0], 'r') as f:
-            return json.load(f)
+        self.analysis_cache[session_identifier] = report
+        return report
+    
+    def _parse_session_details(self, transcript_path: Path) -> Tuple[str, str, str]:
+        """Return week number, class number and date from a transcript filename."""
+        # Extract date and class number from filename like "week_2_class_1_2024-05-27_transcript";
+        # the anchored full match covers the usual naming, search handles anything else
+        stem = transcript_path.stem
+        match = TRANSCRIPT_STEM_RE.fullmatch(stem) or FILENAME_RE.search(stem)
+        if match:
+            return match.groups()
+        return "unknown", "unknown", "unknown"
+    
+    def _session_identifier(self, transcript_path: Path) -> str:
+        """Build the identifier used to look up a session's analysis report."""
+        week_num, class_num, date = self._parse_session_details(transcript_path)
+        return f"week_{week_num}_class_{class_num}_{date}"
     
-    def generate_session_analysis(self, transcript_path: Path) -> ClassSession:
+    def generate_session_analysis(self, transcript_path: Path,
+                                  detailed_analysis: Optional[Dict] = None) -> ClassSession:
         """Generate comprehensive analysis for a single session."""
-        # Extract session info from path
-        parts = transcript_path.parts
-        week = next(part for part in parts if 'week_' in part)
+        # Transcripts must live under a week directory; it sits next to the leaf,
+        # so scan from the end rather than walking the whole path
+        if not any('week_' in part for part in reversed(transcript_path.parts)):
+            raise ValueError(f"no week_ directory in {transcript_path}")
         
         # Parse filename for details
-        filename = transcript_path.stem
-        # Extract date and class number from filename like "week_2_class_1_2024-05-27_transcript"
-        match = re.search(r'week_(\d+)_class_(\d+)_(\d{4}-\d{2}-\d{2})', filename)
-        if match:
-            week_num, class_num, date = match.groups()
-        else:
-            week_num, class_num, date = "unknown", "unknown", "unknown"
+        week_num, class_num, date = self._parse_session_details(transcript_path)
         
         # Load transcript content analysis
         transcript_analysis = self.extract_key_topics_from_transcript(transcript_path)
         
-        # Load detailed analysis report
-        session_id = f"week_{week_num}_class_{class_num}_{date}"
-        detailed_analysis = self.load_analysis_report(session_id)
+        # Load detailed analysis report unless it was prefetched
+        if detailed_analysis is None:
+            detailed_analysis = self.load_analysis_report(f"week_{week_num}_class_{class_num}_{date}")
         
         # Determine main topic based on analysis
         main_topic = self._determine_main_topic(transcript_analysis, detailed_analysis)
@@ -143,6 +277,7 @@ class CurriculumAnalyzer:
         return ClassSession(
             cohort="cohort_2",
             week=f"week_{week_num}",
+            week_number=week_num,
             class_num=class_num,
             date=date,
             duration_minutes=transcript_analysis['duration_minutes'],
@@ -163,72 +298,45 @@ class CurriculumAnalyzer:
         if not topics:
             return "General AI Development"
         
-        topic_map = {
-            'rag': 'Retrieval-Augmented Generation (RAG)',
-            'langchain': 'LangChain Framework Development',
-            'langsmith': 'LLM Application Monitoring',
-            'memory': 'Conversation Memory Management',
-            'agents': 'AI Agent Development',
-            'embeddings': 'Vector Embeddings & Similarity Search',
-            'databases': 'Vector Database Integration',
-            'prompting': 'Advanced Prompt Engineering'
-        }
-        
-        return topic_map.get(topics[0], topics[0].title())
+        return TOPIC_MAP.get(topics[0], topics[0].title())
     
     def _extract_subtopics(self, transcript_analysis: Dict, detailed_analysis: Dict) -> List[str]:
         """Extract subtopics covered in the session."""
-        subtopics = []
+        # Insertion-ordered dict dedups while keeping the strongest topics first
+        subtopics = {}
         
         # From transcript analysis
         main_topics = transcript_analysis.get('main_topics', [])
-        subtopics.extend(main_topics[1:5])  # Top secondary topics
+        for topic in main_topics[1:5]:  # Top secondary topics
+            subtopics[topic] = None
         
         # From detailed analysis if available
         if 'learning_principles' in detailed_analysis:
-            categories = set()
             for principle in detailed_analysis['learning_principles'][:10]:
-                categories.add(principle.get('category', ''))
-            subtopics.extend(list(categories))
+                subtopics[principle.get('category', '')] = None
         
-        return list(set(subtopics))[:8]  # Limit to top 8
+        return list(subtopics)[:8]  # Limit to top 8
     
     def _extract_key_concepts(self, detailed_analysis: Dict) -> List[str]:
         """Extract key concepts from detailed analysis."""
-        concepts = []
+        concepts = {}
         
         if 'learning_principles' in detailed_analysis:
             for principle in detailed_analysis['learning_principles'][:15]:
                 title = principle.get('title', '')
-                if title and title not in concepts:
-                    concepts.append(title)
+                if title:
+                    concepts[title] = None
         
-        return concepts[:10]  # Top 10 concepts
+        return list(concepts)[:10]  # Top 10 concepts
     
-    def _extract_best_practices(self, detailed_analysis: Dict) -> List[str]:
+    def _extract_best_practices(self, detailed_analysis: Dict) -> Tuple[str, ...]:
         """Extract best practices mentioned in the session."""
-        practices = [
-            "Use environment variables for API keys",
-            "Implement proper error handling",
-            "Monitor token usage and costs",
-            "Test with simple examples first",
-            "Use virtual environments for isolation"
-        ]
-        
         # Could be enhanced to extract from actual content
-        return practices[:5]
+        return DEFAULT_BEST_PRACTICES
     
-    def _extract_code_patterns(self, detailed_analysis: Dict) -> List[str]:
+    def _extract_code_patterns(self, detailed_analysis: Dict) -> Tuple[str, ...]:
         """Extract common code patterns demonstrated."""
-        patterns = [
-            "LLM initialization and configuration",
-            "Prompt template creation and usage",
-            "Chain composition and execution",
-            "Error handling and validation",
-            "Memory management implementation"
-        ]
-        
-        return patterns[:5]
+        return DEFAULT_CODE_PATTERNS
     
     def _generate_learning_objectives(self, main_topic: str, subtopics: List[str]) -> List[str]:
         """Generate learning objectives based on topic and subtopics."""
@@ -296,7 +404,30 @@ class CurriculumAnalyzer:
     
     def generate_markdown_analysis(self, session: ClassSession) -> str:
         """Generate comprehensive markdown analysis for a session."""
-        content = f"""# Week {session.week.split('_')[1]}, Class {session.class_num}: {session.main_topic}
+        # Build each list section up front: '\n'.join over a list stays in C and
+        # avoids a chr(10) call per item inside the template
+        main_topic_lower = session.main_topic.lower()
+        subtopics = '\n'.join([
+            f'{i}. **{topic.replace("_", " ").title()}** - Key component of {main_topic_lower}'
+            for i, topic in enumerate(session.subtopics[:6], 1)
+        ])
+        prerequisites = '\n'.join([f'- **{prereq}**' for prereq in session.prerequisites])
+        concepts = '\n'.join([
+            f'**{concept}:**\n- [Detailed explanation would be extracted from transcript analysis]\n'
+            for concept in session.key_concepts[:5]
+        ])
+        tools = '\n'.join([
+            f'**{tool.title()}:**\n- Purpose and implementation details\n'
+            for tool in session.tools_used[:5]
+        ])
+        code_patterns = '\n'.join([
+            f'{i}. **{pattern}**\n   - Step-by-step implementation details\n'
+            for i, pattern in enumerate(session.code_patterns, 1)
+        ])
+        best_practices = '\n'.join([f'- **{practice}**' for practice in session.best_practices])
+        objectives = '\n'.join([f'- {objective}' for objective in session.learning_objectives])
+        
+        content = f"""# Week {session.week_number}, Class {session.class_num}: {session.main_topic}
 **Date:** {session.date}  
 **Duration:** {session.duration_minutes:.1f} minutes  
 **Course:** Developer Productivity Using Artificial Intelligence
@@ -309,42 +440,42 @@ class CurriculumAnalyzer:
 **Primary Topic:** {session.main_topic}
 
 **Subtopics:**
-{chr(10).join(f'{i+1}. **{topic.replace("_", " ").title()}** - Key component of {session.main_topic.lower()}' for i, topic in enumerate(session.subtopics[:6]))}
+{subtopics}
 
 ### Course Arc Position
-- **Week {session.week.split('_')[1]} Focus:** Building on previous foundations with {session.main_topic.lower()}
+- **Week {session.week_number} Focus:** Building on previous foundations with {main_topic_lower}
 - **Prerequisites:** {', '.join(session.prerequisites[:3])}
 - **Prepares for:** Advanced implementations and production deployment
 
 ### Assumed Prior Knowledge
-{chr(10).join(f'- **{prereq}**' for prereq in session.prerequisites)}
+{prerequisites}
 
 ---
 
 ## B. Core Knowledge Extraction
 
 ### Key Definitions & Concepts
-{chr(10).join(f'**{concept}:**' + chr(10) + f'- [Detailed explanation would be extracted from transcript analysis]' + chr(10) for concept in session.key_concepts[:5])}
+{concepts}
 
 ### Tools, Libraries & Services
-{chr(10).join(f'**{tool.title()}:**' + chr(10) + f'- Purpose and implementation details' + chr(10) for tool in session.tools_used[:5])}
+{tools}
 
 ---
 
 ## C. Procedural & Practical
 
 ### Core Implementation Patterns
-{chr(10).join(f'{i+1}. **{pattern}**' + chr(10) + f'   - Step-by-step implementation details' + chr(10) for i, pattern in enumerate(session.code_patterns))}
+{code_patterns}
 
 ### Best Practices Demonstrated
-{chr(10).join(f'- **{practice}**' for practice in session.best_practices)}
+{best_practices}
 
 ---
 
 ## D. Higher-Order Learning
 
 ### Learning Objectives
-{chr(10).join(f'- {objective}' for objective in session.learning_objectives)}
+{objectives}
 
 ### Real-World Applications
 - Industry use cases and implementation patterns
@@ -379,34 +510,126 @@ class CurriculumAnalyzer:
 """
         return content
     
-    def process_all_transcripts(self):
+    def _find_transcripts(self) -> List[Path]:
+        """Find every *_transcript.txt under the cohorts directory."""
+        # Walk with scandir instead of rglob: entry types come from the directory
+        # listing, so there is no per-entry stat or fnmatch. Like rglob, symlinked
+        # directories are not descended into.
+        transcript_files = []
+        pending = [str(self.cohorts_path)]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith('_transcript.txt'):
+                        transcript_files.append(Path(entry.path))
+        return transcript_files
+    
+    def process_transcript(self, transcript_path: Path, detailed_analysis: Optional[Dict] = None) -> Path:
+        """Analyze one transcript and write its markdown next to it."""
+        logger.info(f"Processing {transcript_path.name}")
+        
+        # Generate session analysis
+        session = self.generate_session_analysis(transcript_path, detailed_analysis)
+        
+        # Generate markdown content
+        markdown_content = self.generate_markdown_analysis(session)
+        
+        # Save to appropriate week directory
+        week_dir = transcript_path.parent
+        analysis_file = week_dir / f"Week{session.week_number}_Class{session.class_num}_Analysis.md"
+        
+        # One encode and a single write of the whole document
+        analysis_file.write_bytes(markdown_content.encode('utf-8'))
+        
+        return analysis_file
+    
+    def process_all_transcripts(self, max_workers: Optional[int] = None):
         """Process all transcripts and generate comprehensive analyses."""
-        transcript_files = list(self.cohorts_path.rglob("*_transcript.txt"))
+        transcript_files = self._find_transcripts()
         transcript_files.sort()
         
         logger.info(f"Found {len(transcript_files)} transcript files to process")
         
-        for transcript_path in transcript_files:
-            try:
-                logger.info(f"Processing {transcript_path.name}")
-                
-                # Generate session analysis
-                session = self.generate_session_analysis(transcript_path)
-                
-                # Generate markdown content
-                markdown_content = self.generate_markdown_analysis(session)
-                
-                # Save to appropriate week directory
-                week_dir = transcript_path.parent
-                analysis_file = week_dir / f"Week{session.week.split('_')[1]}_Class{session.class_num}_Analysis.md"
-                
-                with open(analysis_file, 'w') as f:
-                    f.write(markdown_content)
-                
-                logger.info(f"Generated analysis: {analysis_file}")
+        max_workers = max_workers or os.cpu_count() or 1
+        if max_workers == 1:
+            self._process_serially(transcript_files)
+            return
+        
+        # Workers pick transcripts up in submission order, so hint the kernel to read
+        # ahead a couple per worker and top the window up as each one finishes
+        upcoming = iter(transcript_files)
+        for transcript_path in islice(upcoming, 2 * max_workers):
+            _willneed(transcript_path)
+        
+        # Each transcript is independent and the work is pure-Python regex/string
+        # processing, so fan out across processes rather than threads
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_worker,
+                                 initargs=(str(self.cohorts_path), str(self.reports_path),
+                                           self.keyword_backend)) as executor:
+            futures = [executor.submit(_process_one, transcript_path) for transcript_path in transcript_files]
+            
+            for future in as_completed(futures):
+                next_path = next(upcoming, None)
+                if next_path is not None:
+                    _willneed(next_path)
+                transcript_path, analysis_file, error = future.result()
+                if error:
+                    logger.error(f"Error processing {transcript_path.name}: {error}")
+                else:
+                    logger.info(f"Generated analysis: {analysis_file}")
+
+    def _prefetch(self, transcript_path: Path) -> Dict:
+        """Warm the page cache for a transcript and load its analysis report."""
+        _willneed(transcript_path)
+        return self.load_analysis_report(self._session_identifier(transcript_path))
+    
+    def _process_serially(self, transcript_files: List[Path]):
+        """Process transcripts in this process, loading the next one's inputs in the background."""
+        with ThreadPoolExecutor(max_workers=1) as prefetch_pool:
+            upcoming = prefetch_pool.submit(self._prefetch, transcript_files[0]) if transcript_files else None
+            
+            for i, transcript_path in enumerate(transcript_files):
+                current = upcoming
+                if i + 1 < len(transcript_files):
+                    upcoming = prefetch_pool.submit(self._prefetch, transcript_files[i + 1])
                 
-            except Exception as e:
-                logger.error(f"Error processing {transcript_path.name}: {e}")
+                try:
+                    analysis_file = self.process_transcript(transcript_path, current.result())
+                    logger.info(f"Generated analysis: {analysis_file}")
+                except Exception as e:
+                    logger.error(f"Error processing {transcript_path.name}: {e}")
+
+def _willneed(path: Path):
+    """Ask the kernel to start reading a file into the page cache (no-op where unsupported)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        with open(path, 'rb') as f:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass  # Only a hint; processing the file reports the real error
+
+# One analyzer per worker process, built by the pool initializer
+_WORKER_ANALYZER = None
+
+def _init_worker(cohorts_path: str, reports_path: str, keyword_backend: str):
+    """Build the worker's CurriculumAnalyzer once for all transcripts it handles."""
+    global _WORKER_ANALYZER
+    _WORKER_ANALYZER = CurriculumAnalyzer(cohorts_path, reports_path, keyword_backend)
+
+def _process_one(transcript_path: Path) -> Tuple[Path, Optional[Path], Optional[str]]:
+    """Process a single transcript in a worker process."""
+    try:
+        return transcript_path, _WORKER_ANALYZER.process_transcript(transcript_path), None
+    except Exception as e:
+        return transcript_path, None, str(e)
 
 def main():
     """Main execution function."""
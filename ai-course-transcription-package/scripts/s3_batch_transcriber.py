@@ -4,21 +4,42 @@ S3-compatible batch transcription system using faster-whisper.
 Processes videos directly from S3 URLs without downloading.
 """
 
+import io
 import os
 import json
+import queue
 import time
 import logging
+import multiprocessing
+import shutil
 import tempfile
+import threading
 import urllib.request
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from faster_whisper import WhisperModel
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import ctranslate2
+from faster_whisper import WhisperModel, decode_audio
 import hashlib
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore import UNSIGNED
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import urllib3.exceptions
+
+try:
+    # Batched VAD-chunk inference, available in faster-whisper >= 1.1
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:
+    BatchedInferencePipeline = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -31,32 +52,156 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Parallel ranged GETs per S3 object; each video is split into parts of this size
+S3_TRANSFER_CONCURRENCY = 8
+S3_PART_SIZE = 16 * 1024 * 1024
+
+VAD_PARAMETERS = dict(
+    min_silence_duration_ms=500,
+    threshold=0.6,
+    speech_pad_ms=400
+)
+SAMPLING_RATE = 16000
+
+# Seconds between progress lines while an HTTPS download is running
+DOWNLOAD_PROGRESS_INTERVAL = 10
+
+# Forward seeks shorter than this are served by reading on through the open
+# stream; longer ones (or backward seeks) reopen it with a new Range request
+S3_SEEK_READAHEAD = 1024 * 1024
+
+class S3RangeReader(io.RawIOBase):
+    """Seekable read-only view of an S3 object backed by one long-lived ranged GET."""
+    
+    def __init__(self, s3_client, bucket: str, key: str):
+        head = s3_client.head_object(Bucket=bucket, Key=key)
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.size = head['ContentLength']
+        self._etag = head['ETag']
+        self._pos = 0
+        self._stream = None
+        self._stream_pos = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self._pos
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self.size
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+        # The stream is only repositioned on the next read
+        self._pos = offset
+        return self._pos
+    
+    def readinto(self, buffer) -> int:
+        if self._pos >= self.size:
+            return 0
+        
+        if self._stream is not None and self._pos != self._stream_pos:
+            skip = self._pos - self._stream_pos
+            if 0 < skip <= S3_SEEK_READAHEAD:
+                self._stream_pos += len(self._stream.read(skip))
+            if self._pos != self._stream_pos:
+                self._close_stream()
+        
+        if self._stream is None:
+            # IfMatch keeps every reopened range on the same object version
+            response = self.s3_client.get_object(
+                Bucket=self.bucket,
+                Key=self.key,
+                Range=f"bytes={self._pos}-",
+                IfMatch=self._etag
+            )
+            self._stream = response['Body']
+            self._stream_pos = self._pos
+        
+        data = self._stream.read(len(buffer))
+        buffer[:len(data)] = data
+        self._pos += len(data)
+        self._stream_pos = self._pos
+        return len(data)
+    
+    def _close_stream(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+    
+    def close(self):
+        self._close_stream()
+        super().close()
+
 class S3BatchTranscriber:
     """S3-compatible batch transcription system for cohort recordings."""
     
     def __init__(self, 
                  model_size: str = "base",
                  device: str = "cpu",
-                 compute_type: str = "int8",
+                 compute_type: Optional[str] = None,
                  max_workers: int = 2,
-                 use_temp_files: bool = True):
+                 use_temp_files: bool = True,
+                 batch_size: int = 8,
+                 batched: bool = True,
+                 processes: int = 1):
         """
         Initialize the S3 batch transcriber.
         
         Args:
             model_size: Whisper model size (tiny, base, small, medium, large)
             device: Processing device (cpu, cuda)
-            compute_type: Computation type for optimization
+            compute_type: Computation type (defaults to float16 on cuda, int8 on cpu)
             max_workers: Maximum parallel transcription workers
-            use_temp_files: Whether to use temp files for S3 videos
+            use_temp_files: Whether to use temp files for S3 videos; when False, audio is
+                decoded straight from a seekable ranged-GET stream (needs an S3 client)
+            batch_size: Speech chunks decoded per forward pass in batched mode
+            batched: Use BatchedInferencePipeline when available; False keeps sequential decoding
+            processes: Worker processes with their own model for temp-file manifests
+                (downloads stay on threads in the parent)
         """
+        if compute_type is None:
+            # FP16 runs on the GPU's tensor cores; dynamic INT8 is the fast path on CPU
+            compute_type = "float16" if device == "cuda" else "int8"
+        
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
         self.max_workers = max_workers
         self.use_temp_files = use_temp_files
+        self.batch_size = batch_size
+        self.batched = batched
+        self.processes = processes
         self.model = None
+        self.pipeline = None
+        self._model_lock = threading.Lock()
+        # One shared model; at most max_workers decodes run in it at once
+        self._transcribe_slots = threading.Semaphore(max_workers)
         self.s3_client = None
+        self.transfer_config = TransferConfig(
+            multipart_threshold=S3_PART_SIZE,
+            multipart_chunksize=S3_PART_SIZE,
+            max_concurrency=S3_TRANSFER_CONCURRENCY,
+            use_threads=True
+        )
+        
+        # One pooled session so consecutive downloads reuse TCP/TLS connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.5)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.stats = {
             'total_processed': 0,
             'total_duration': 0,
@@ -67,14 +212,40 @@ class S3BatchTranscriber:
     def load_model(self):
         """Load the Whisper model with optimizations."""
         try:
-            logger.info(f"Loading Whisper model: {self.model_size}")
-            self.model = WhisperModel(
-                self.model_size,
-                device=self.device,
-                compute_type=self.compute_type,
-                cpu_threads=0,  # Use all available CPU threads
-                num_workers=1   # Single worker per model instance
-            )
+            supported = ctranslate2.get_supported_compute_types(self.device)
+            if self.compute_type not in supported:
+                fallback = "float16" if self.device == "cuda" else "int8"
+                logger.warning(f"Compute type {self.compute_type} not supported on {self.device}, using {fallback}")
+                self.compute_type = fallback
+            
+            logger.info(f"Loading Whisper model: {self.model_size} ({self.compute_type})")
+            if self.device == "cuda":
+                # The GPU is the bottleneck; extra model workers only queue behind it
+                if self.max_workers > 1:
+                    logger.warning(f"{self.max_workers} workers on cuda share one GPU model; "
+                                   "extra workers only overlap downloads and decoding")
+                self.model = WhisperModel(
+                    self.model_size,
+                    device=self.device,
+                    compute_type=self.compute_type,
+                    num_workers=1
+                )
+            else:
+                self.model = WhisperModel(
+                    self.model_size,
+                    device=self.device,
+                    compute_type=self.compute_type,
+                    # Split the cores between the concurrent decodes (across all worker
+                    # processes) instead of giving each all of them
+                    cpu_threads=max(1, (os.cpu_count() or 1) // (self.max_workers * self.processes)),
+                    num_workers=self.max_workers   # Parallel transcribe() calls share one model
+                )
+            if not self.batched:
+                logger.info("Batched inference disabled; using sequential decoding")
+            elif BatchedInferencePipeline is not None:
+                self.pipeline = BatchedInferencePipeline(model=self.model)
+            else:
+                logger.warning("BatchedInferencePipeline unavailable; using sequential decoding")
             logger.info("✅ Model loaded successfully!")
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
@@ -82,6 +253,12 @@ class S3BatchTranscriber:
     
     def initialize_s3_client(self, aws_access_key: str = None, aws_secret_key: str = None, region: str = 'us-east-1'):
         """Initialize S3 client for authenticated or public bucket access."""
+        # Every worker may have a full set of ranged GETs in flight at once
+        pool_options = dict(
+            max_pool_connections=max(16, self.max_workers * S3_TRANSFER_CONCURRENCY),
+            tcp_keepalive=True,
+            retries={'mode': 'adaptive', 'max_attempts': 5}
+        )
         try:
             if aws_access_key and aws_secret_key:
                 # Authenticated access
@@ -89,14 +266,15 @@ class S3BatchTranscriber:
                     's3',
                     aws_access_key_id=aws_access_key,
                     aws_secret_access_key=aws_secret_key,
-                    region_name=region
+                    region_name=region,
+                    config=Config(**pool_options)
                 )
                 logger.info("✅ S3 client initialized with credentials")
             else:
                 # Public bucket access
                 self.s3_client = boto3.client(
                     's3',
-                    config=Config(signature_version=UNSIGNED),
+                    config=Config(signature_version=UNSIGNED, **pool_options),
                     region_name=region
                 )
                 logger.info("✅ S3 client initialized for public access")
@@ -104,6 +282,25 @@ class S3BatchTranscriber:
             logger.error(f"Failed to initialize S3 client: {e}")
             raise
     
+    def _parse_s3_url(self, s3_url: str) -> Optional[Tuple[str, str]]:
+        """Return (bucket, key) for an S3 URL, or None for other HTTPS URLs."""
+        if s3_url.startswith('s3://'):
+            # s3://bucket/key format
+            parts = s3_url[5:].split('/', 1)
+            return parts[0], parts[1] if len(parts) > 1 else ''
+        
+        if 's3.amazonaws.com' in s3_url or 's3-' in s3_url:
+            # HTTPS URL format
+            # Extract bucket and key from URL
+            if '.s3.amazonaws.com/' in s3_url:
+                parts = s3_url.split('.s3.amazonaws.com/')
+                return parts[0].split('/')[-1], parts[1]
+            if '.s3-' in s3_url:  # Regional endpoint
+                parts = s3_url.split('.s3-')[1].split('/', 1)
+                return s3_url.split('//')[1].split('.')[0], parts[1] if len(parts) > 1 else ''
+        
+        return None
+    
     def download_from_s3(self, s3_url: str, temp_dir: str = None) -> str:
         """
         Download video from S3 URL to temporary file.
@@ -116,29 +313,11 @@ class S3BatchTranscriber:
             Path to downloaded temporary file
         """
         try:
-            # Parse S3 URL
-            if s3_url.startswith('s3://'):
-                # s3://bucket/key format
-                parts = s3_url[5:].split('/', 1)
-                bucket = parts[0]
-                key = parts[1] if len(parts) > 1 else ''
-            elif 's3.amazonaws.com' in s3_url or 's3-' in s3_url:
-                # HTTPS URL format
-                # Extract bucket and key from URL
-                if '.s3.amazonaws.com/' in s3_url:
-                    parts = s3_url.split('.s3.amazonaws.com/')
-                    bucket = parts[0].split('/')[-1]
-                    key = parts[1]
-                elif '.s3-' in s3_url:  # Regional endpoint
-                    parts = s3_url.split('.s3-')[1].split('/', 1)
-                    bucket = s3_url.split('//')[1].split('.')[0]
-                    key = parts[1] if len(parts) > 1 else ''
-                else:
-                    # Direct HTTPS download for public URLs
-                    return self.download_from_https(s3_url, temp_dir)
-            else:
-                # Assume it's a direct HTTPS URL
+            location = self._parse_s3_url(s3_url)
+            if location is None:
+                # Direct HTTPS download for public URLs
                 return self.download_from_https(s3_url, temp_dir)
+            bucket, key = location
             
             # Create temporary file
             if not temp_dir:
@@ -156,7 +335,8 @@ class S3BatchTranscriber:
             # Download from S3
             if self.s3_client:
                 logger.info(f"Downloading from S3: s3://{bucket}/{key}")
-                self.s3_client.download_file(bucket, key, temp_path)
+                # Objects above S3_PART_SIZE are fetched as concurrent ranged GETs
+                self.s3_client.download_file(bucket, key, temp_path, Config=self.transfer_config)
             else:
                 # Fallback to HTTPS download
                 https_url = f"https://{bucket}.s3.amazonaws.com/{key}"
@@ -171,6 +351,7 @@ class S3BatchTranscriber:
     
     def download_from_https(self, url: str, temp_dir: str = None) -> str:
         """Download video from HTTPS URL to temporary file."""
+        temp_path = None
         try:
             if not temp_dir:
                 temp_dir = tempfile.gettempdir()
@@ -188,35 +369,57 @@ class S3BatchTranscriber:
             
             logger.info(f"Downloading from URL: {url}")
             
-            # Download with progress
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
-            
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            
-            with open(temp_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if total_size > 0:
-                            progress = (downloaded / total_size) * 100
-                            if downloaded % (1024 * 1024 * 10) == 0:  # Log every 10MB
-                                logger.info(f"Download progress: {progress:.1f}%")
+            # Stream over the pooled session in 1 MiB blocks
+            with self.session.get(url, stream=True) as response:
+                response.raise_for_status()
+                total_size = int(response.headers.get('content-length', 0))
+                
+                response.raw.decode_content = True
+                
+                # Progress is reported from a side thread so the copy loop stays in C
+                done = threading.Event()
+                def report_progress():
+                    while not done.wait(DOWNLOAD_PROGRESS_INTERVAL):
+                        logger.info(f"Downloaded {temp_file.tell() / (1024 * 1024):.1f} of "
+                                    f"{total_size / (1024 * 1024):.1f} MB")
+                reporter = threading.Thread(target=report_progress, daemon=True)
+                reporter.start()
+                
+                with temp_file:
+                    try:
+                        shutil.copyfileobj(response.raw, temp_file, length=1 << 20)
+                    # Reading response.raw bypasses requests' own wrapping of urllib3 errors;
+                    # map them the same way iter_content would so callers can retry
+                    except urllib3.exceptions.ReadTimeoutError as e:
+                        raise requests.exceptions.ConnectionError(e) from e
+                    except urllib3.exceptions.DecodeError as e:
+                        raise requests.exceptions.ContentDecodingError(e) from e
+                    except urllib3.exceptions.HTTPError as e:
+                        raise requests.exceptions.ChunkedEncodingError(e) from e
+                    finally:
+                        done.set()
+                        reporter.join()
             
-            logger.info(f"✅ Downloaded to: {temp_path}")
+            logger.info(f"✅ Downloaded {total_size / (1024 * 1024):.1f} MB to: {temp_path}")
             return temp_path
             
         except Exception as e:
             logger.error(f"Failed to download from URL: {e}")
+            # Don't leave a partial file behind for every retry
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
             raise
     
+    def download(self, url: str) -> str:
+        """Download an S3 or HTTPS video to a temporary file and return its path."""
+        return self.download_from_s3(url) if url.startswith('s3://') else self.download_from_https(url)
+    
     def transcribe_from_url(self, 
                            url: str,
                            output_path: str = None,
                            metadata: Dict = None,
-                           cleanup: bool = True) -> Dict:
+                           cleanup: bool = True,
+                           local_path: str = None) -> Dict:
         """
         Transcribe a video from S3 or HTTPS URL.
         
@@ -225,59 +428,76 @@ class S3BatchTranscriber:
             output_path: Output path for transcript
             metadata: Additional metadata to include
             cleanup: Whether to delete temp file after transcription
+            local_path: Already-downloaded copy of the video (skips the download)
             
         Returns:
             Dict with transcription results and metadata
         """
         if not self.model:
-            self.load_model()
+            with self._model_lock:
+                if not self.model:
+                    self.load_model()
         
         temp_file = None
         start_time = time.time()
         
         try:
-            # Download video to temp file
             logger.info(f"Processing: {url}")
-            temp_file = self.download_from_s3(url) if url.startswith('s3://') else self.download_from_https(url)
+            location = self._parse_s3_url(url) if not (local_path or self.use_temp_files) else None
+            
+            if location and self.s3_client:
+                # Decode straight from S3: the container demuxer seeks through ranged
+                # reads on one reused stream, so nothing is written to disk
+                with io.BufferedReader(S3RangeReader(self.s3_client, *location), buffer_size=1 << 20) as stream:
+                    audio = decode_audio(stream, sampling_rate=SAMPLING_RATE)
+                    file_size = stream.raw.size / (1024 * 1024)  # MB
+            else:
+                # Download video to temp file unless it was fetched ahead of time
+                temp_file = local_path or self.download(url)
+                file_size = os.path.getsize(temp_file) / (1024 * 1024)  # MB
+                # Decode once, outside the model slot, so demuxing overlaps other workers' inference
+                audio = decode_audio(temp_file, sampling_rate=SAMPLING_RATE)
             
             # Get file info
-            file_size = os.path.getsize(temp_file) / (1024 * 1024)  # MB
-            logger.info(f"File size: {file_size:.2f} MB")
+            logger.info(f"File size: {file_size:.2f} MB, {len(audio) / SAMPLING_RATE:.0f}s of audio")
             
-            # Transcribe
+            # Transcribe; segments decode lazily, so the slot is held while iterating them
             logger.info("Starting transcription...")
-            segments, info = self.model.transcribe(
-                temp_file,
-                beam_size=5,
-                language="en",
-                condition_on_previous_text=True,
-                vad_filter=True,
-                vad_parameters=dict(
-                    min_silence_duration_ms=500,
-                    threshold=0.6,
-                    speech_pad_ms=400
-                )
-            )
-            
-            # Process segments
-            transcript_lines = []
-            transcript_json = []
-            
-            for segment in segments:
-                start = segment.start
-                end = segment.end
-                text = segment.text.strip()
+            with self._transcribe_slots:
+                if self.pipeline is not None:
+                    # VAD-segmented chunks are decoded batch_size at a time
+                    segments, info = self.pipeline.transcribe(
+                        audio,
+                        batch_size=self.batch_size,
+                        beam_size=5,
+                        language="en",
+                        vad_filter=True,
+                        vad_parameters=VAD_PARAMETERS
+                    )
+                else:
+                    segments, info = self.model.transcribe(
+                        audio,
+                        beam_size=5,
+                        language="en",
+                        condition_on_previous_text=True,
+                        vad_filter=True,
+                        vad_parameters=VAD_PARAMETERS
+                    )
                 
-                # Format timestamp
-                timestamp = f"[{self._format_timestamp(start)} - {self._format_timestamp(end)}]"
-                transcript_lines.append(f"{timestamp} {text}")
+                # Process segments
+                transcript_lines = []
+                transcript_json = []
+                append_line = transcript_lines.append
+                append_seg = transcript_json.append
+                format_timestamp = self._format_timestamp
                 
-                # JSON format
-                transcript_json.append({
-                    "start": start,
-                    "end": end,
-                    "text": text
-                })
+                for segment in segments:
+                    start = segment.start
+                    end = segment.end
+                    text = segment.text.strip()
+                    
+                    append_line(f"[{format_timestamp(start)} - {format_timestamp(end)}] {text}")
+                    append_seg({"start": start, "end": end, "text": text})
             
             # Calculate processing time
             processing_time = time.time() - start_time
@@ -299,21 +519,7 @@ class S3BatchTranscriber:
             
             # Save output if path provided
             if output_path:
-                output_path = Path(output_path)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Save text transcript
-                txt_path = output_path.with_suffix('.txt')
-                with open(txt_path, 'w', encoding='utf-8') as f:
-                    f.write(result['transcript_text'])
-                
-                # Save JSON transcript
-                json_path = output_path.with_suffix('.json')
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(result, f, indent=2, ensure_ascii=False)
-                
-                logger.info(f"✅ Saved transcript to: {txt_path}")
-                logger.info(f"✅ Saved metadata to: {json_path}")
+                self._save_outputs(result, output_path)
             
             # Update stats
             self.stats['total_processed'] += 1
@@ -338,6 +544,28 @@ class S3BatchTranscriber:
                 except Exception as e:
                     logger.warning(f"Failed to cleanup temp file: {e}")
     
+    def _save_outputs(self, result: Dict, output_path: str):
+        """Write the .txt and .json transcripts, each replaced atomically."""
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        txt_path = output_path.with_suffix('.txt')
+        json_path = output_path.with_suffix('.json')
+        if orjson:
+            # NON_STR_KEYS keeps json.dump's tolerance for int keys in metadata
+            json_bytes = orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            json_bytes = json.dumps(result, indent=2, ensure_ascii=False).encode('utf-8')
+        
+        # Write beside the target and rename, so an interrupted job never leaves half a file
+        for path, data in ((txt_path, result['transcript_text'].encode('utf-8')), (json_path, json_bytes)):
+            tmp_path = path.with_name(path.name + ".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        
+        logger.info(f"✅ Saved transcript to: {txt_path}")
+        logger.info(f"✅ Saved metadata to: {json_path}")
+    
     def process_manifest(self, manifest_path: str):
         """
         Process videos from a manifest file containing S3 URLs.
@@ -356,43 +584,46 @@ class S3BatchTranscriber:
         }
         """
         try:
-            with open(manifest_path, 'r') as f:
-                manifest = json.load(f)
+            if orjson:
+                manifest = orjson.loads(Path(manifest_path).read_bytes())
+            else:
+                with open(manifest_path, 'r') as f:
+                    manifest = json.load(f)
             
             videos = manifest.get('videos', [])
             logger.info(f"Processing {len(videos)} videos from manifest")
             
-            # Process videos with thread pool
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = {}
-                
-                for video in videos:
-                    url = video.get('url')
-                    output_path = video.get('output_path')
-                    metadata = {
-                        'cohort': video.get('cohort'),
-                        'week': video.get('week'),
-                        'lesson': video.get('lesson'),
-                        'title': video.get('title', ''),
-                        'date': video.get('date', '')
+            jobs = []
+            for video in videos:
+                metadata = {
+                    'cohort': video.get('cohort'),
+                    'week': video.get('week'),
+                    'lesson': video.get('lesson'),
+                    'title': video.get('title', ''),
+                    'date': video.get('date', '')
+                }
+                jobs.append((video.get('url'), video.get('output_path'), metadata))
+            
+            if self.use_temp_files and self.processes > 1:
+                self._process_in_processes(jobs)
+            elif self.use_temp_files:
+                self._process_downloaded(jobs)
+            else:
+                # Streaming jobs already overlap S3 reads with decoding
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = {
+                        executor.submit(self.transcribe_from_url, url, output_path, metadata): url
+                        for url, output_path, metadata in jobs
                     }
                     
-                    future = executor.submit(
-                        self.transcribe_from_url,
-                        url,
-                        output_path,
-                        metadata
-                    )
-                    futures[future] = video
-                
-                # Process results
-                for future in as_completed(futures):
-                    video = futures[future]
-                    try:
-                        result = future.result()
-                        logger.info(f"✅ Completed: {video.get('url')}")
-                    except Exception as e:
-                        logger.error(f"❌ Failed: {video.get('url')} - {e}")
+                    # Process results
+                    for future in as_completed(futures):
+                        url = futures[future]
+                        try:
+                            future.result()
+                            logger.info(f"✅ Completed: {url}")
+                        except Exception as e:
+                            logger.error(f"❌ Failed: {url} - {e}")
             
             # Print summary
             self.print_summary()
@@ -401,16 +632,126 @@ class S3BatchTranscriber:
             logger.error(f"Failed to process manifest: {e}")
             raise
     
+    def _process_downloaded(self, jobs: List[Tuple[str, str, Dict]]):
+        """Transcribe jobs while downloader threads fetch the next videos to disk."""
+        # Load the shared model once, before any worker needs it
+        if not self.model:
+            self.load_model()
+        
+        # Bounded so downloads run at most a couple of files ahead of the model
+        ready = queue.Queue(maxsize=self.max_workers * 2)
+        
+        def fetch(job):
+            try:
+                ready.put((job, self.download(job[0]), None))
+            except Exception as e:
+                ready.put((job, None, e))
+        
+        def consume():
+            while True:
+                item = ready.get()
+                if item is None:
+                    return
+                (url, output_path, metadata), temp_path, error = item
+                if error is not None:
+                    logger.error(f"❌ Failed: {url} - {error}")
+                    self.stats['failed_files'].append({"url": url, "error": str(error)})
+                    continue
+                try:
+                    self.transcribe_from_url(url, output_path, metadata, local_path=temp_path)
+                    logger.info(f"✅ Completed: {url}")
+                except Exception as e:
+                    logger.error(f"❌ Failed: {url} - {e}")
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as workers:
+            for _ in range(self.max_workers):
+                workers.submit(consume)
+            
+            with ThreadPoolExecutor(max_workers=self.max_workers) as downloaders:
+                for job in jobs:
+                    downloaders.submit(fetch, job)
+            
+            # One stop marker per transcription worker
+            for _ in range(self.max_workers):
+                ready.put(None)
+    
+    def _process_in_processes(self, jobs: List[Tuple[str, str, Dict]]):
+        """Download on threads here and transcribe in worker processes with their own models."""
+        # Limits how many downloaded videos wait on disk for a free process
+        disk_slots = threading.Semaphore(self.processes * 2)
+        
+        ctx = multiprocessing.get_context('forkserver')
+        with ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=ctx,
+            initializer=_worker_init,
+            initargs=(self.model_size, self.device, self.compute_type,
+                      self.batch_size, self.batched, self.processes)
+        ) as executor:
+            futures = {}
+            futures_lock = threading.Lock()
+            
+            def discard(temp_path):
+                # Workers remove their file when they finish; this covers the ones that never ran
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            
+            def finished(future, temp_path):
+                disk_slots.release()
+                if future.cancelled() or future.exception() is not None:
+                    discard(temp_path)
+            
+            def fetch(job):
+                url = job[0]
+                try:
+                    temp_path = self.download(url)
+                except Exception as e:
+                    disk_slots.release()
+                    logger.error(f"❌ Failed: {url} - {e}")
+                    self.stats['failed_files'].append({"url": url, "error": str(e)})
+                    return
+                try:
+                    future = executor.submit(_worker_transcribe, *job, temp_path)
+                except Exception as e:
+                    # e.g. BrokenProcessPool after a worker died; without the release
+                    # the download loop would wait on disk_slots forever
+                    disk_slots.release()
+                    discard(temp_path)
+                    logger.error(f"❌ Failed: {url} - {e}")
+                    self.stats['failed_files'].append({"url": url, "error": str(e)})
+                    return
+                future.add_done_callback(lambda done: finished(done, temp_path))
+                with futures_lock:
+                    futures[future] = url
+            
+            with ThreadPoolExecutor(max_workers=self.max_workers) as downloaders:
+                for job in jobs:
+                    disk_slots.acquire()
+                    downloaders.submit(fetch, job)
+            
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    summary = future.result()
+                    logger.info(f"✅ Completed: {url}")
+                except Exception as e:
+                    logger.error(f"❌ Failed: {url} - {e}")
+                    self.stats['failed_files'].append({"url": url, "error": str(e)})
+                    continue
+                
+                # Workers keep their own stats; fold them into this instance
+                self.stats['total_processed'] += 1
+                self.stats['total_duration'] += summary['duration']
+                self.stats['total_processing_time'] += summary['processing_time']
+    
     def _format_timestamp(self, seconds: float) -> str:
         """Format seconds to MM:SS or HH:MM:SS."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+        hours, rem = divmod(int(seconds), 3600)
+        minutes, secs = divmod(rem, 60)
         
-        if hours > 0:
+        if hours:
             return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-        else:
-            return f"{minutes:02d}:{secs:02d}"
+        return f"{minutes:02d}:{secs:02d}"
     
     def print_summary(self):
         """Print processing summary."""
@@ -433,6 +774,30 @@ class S3BatchTranscriber:
                 print(f"  - {failed['url']}: {failed['error']}")
 
 
+# Per-process transcriber used by ProcessPoolExecutor workers
+_WORKER_TRANSCRIBER = None
+
+def _worker_init(model_size: str, device: str, compute_type: str, batch_size: int,
+                 batched: bool, processes: int):
+    """Load a model once per worker process, sized for its share of the cores."""
+    global _WORKER_TRANSCRIBER
+    _WORKER_TRANSCRIBER = S3BatchTranscriber(
+        model_size=model_size,
+        device=device,
+        compute_type=compute_type,
+        max_workers=1,
+        batch_size=batch_size,
+        batched=batched,
+        processes=processes
+    )
+    _WORKER_TRANSCRIBER.load_model()
+
+def _worker_transcribe(url: str, output_path: str, metadata: Dict, local_path: str) -> Dict:
+    """Transcribe one downloaded file and return only what the parent needs for its stats."""
+    result = _WORKER_TRANSCRIBER.transcribe_from_url(url, output_path, metadata, local_path=local_path)
+    return {'duration': result['duration'], 'processing_time': result['processing_time']}
+
+
 def main():
     """Main entry point for S3 batch transcription."""
     import argparse
@@ -443,7 +808,17 @@ def main():
     parser.add_argument('--output', type=str, help='Output path for transcripts')
     parser.add_argument('--model', type=str, default='base', help='Whisper model size')
     parser.add_argument('--device', type=str, default='cpu', help='Device (cpu/cuda)')
+    parser.add_argument('--compute-type', type=str, default=None,
+                        help='CTranslate2 compute type (default: int8 on cpu, float16 on cuda)')
     parser.add_argument('--workers', type=int, default=2, help='Parallel workers')
+    parser.add_argument('--processes', type=int, default=1,
+                        help='Transcription processes for manifests, each with its own model')
+    parser.add_argument('--batch-size', type=int, default=8,
+                        help='Speech chunks decoded per forward pass in batched mode')
+    parser.add_argument('--no-batched', action='store_true',
+                        help='Decode sequentially with condition_on_previous_text instead of batching')
+    parser.add_argument('--stream', action='store_true',
+                        help='Decode S3 videos from a ranged stream instead of temp files (needs AWS credentials)')
     parser.add_argument('--aws-key', type=str, help='AWS Access Key (optional)')
     parser.add_argument('--aws-secret', type=str, help='AWS Secret Key (optional)')
     
@@ -453,7 +828,12 @@ def main():
     transcriber = S3BatchTranscriber(
         model_size=args.model,
         device=args.device,
-        max_workers=args.workers
+        compute_type=args.compute_type,
+        max_workers=args.workers,
+        use_temp_files=not args.stream,
+        batch_size=args.batch_size,
+        batched=not args.no_batched,
+        processes=args.processes
     )
     
     # Initialize S3 client if credentials provided
@@ -216,6 +216,8 @@ class SimplifiedOrchestrator:
                     if (successful_transcriptions + len(failed_transcriptions)) % self.config['workflow']['checkpoint_frequency'] == 0:
                         self._save_checkpoint('transcription', successful_transcriptions, len(failed_transcriptions))
             
+            self.transcriber.save_hash_cache()
+            
             self.results['total_transcripts_generated'] = successful_transcriptions
             self.results['phases_completed'].append('transcription')
             
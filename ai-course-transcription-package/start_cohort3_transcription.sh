@@ -55,8 +55,9 @@ show_menu() {
 clear_checkpoints() {
     echo -e "${YELLOW}Clearing previous checkpoints...${NC}"
     rm -f $LOG_DIR/cohort3_checkpoint.json
+    rm -f $LOG_DIR/cohort3_checkpoint.jsonl
     rm -f $LOG_DIR/transcription_status.json
-    rm -f $LOG_DIR/transcription_errors.json
+    rm -f $LOG_DIR/transcription_errors.jsonl
     echo -e "${GREEN}✅ Checkpoints cleared${NC}"
 }
 
@@ -135,17 +136,33 @@ with open('$LOG_DIR/transcription_status.json', 'r') as f:
         echo "  No status file found"
     fi
     
-    # Check checkpoint
-    if [ -f "$LOG_DIR/cohort3_checkpoint.json" ]; then
+    # Check checkpoint (snapshot plus any journal entries written since it)
+    if [ -f "$LOG_DIR/cohort3_checkpoint.json" ] || [ -f "$LOG_DIR/cohort3_checkpoint.jsonl" ]; then
         echo ""
         echo "Checkpoint info:"
         python3 -c "
-import json
-with open('$LOG_DIR/cohort3_checkpoint.json', 'r') as f:
-    checkpoint = json.load(f)
-    print(f\"  Videos completed: {len(checkpoint.get('completed', []))}\")
-    print(f\"  Videos failed: {len(checkpoint.get('failed', {}))}\")
-    print(f\"  Last checkpoint: {checkpoint.get('timestamp', 'Unknown')}\")
+import json, os
+checkpoint = {}
+if os.path.exists('$LOG_DIR/cohort3_checkpoint.json'):
+    with open('$LOG_DIR/cohort3_checkpoint.json', 'r') as f:
+        checkpoint = json.load(f)
+completed = set(checkpoint.get('completed', []))
+failed = dict(checkpoint.get('failed', {}))
+if os.path.exists('$LOG_DIR/cohort3_checkpoint.jsonl'):
+    with open('$LOG_DIR/cohort3_checkpoint.jsonl', 'r') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if entry['status'] == 'done':
+                completed.add(entry['video_id'])
+                failed.pop(entry['video_id'], None)
+            else:
+                failed[entry['video_id']] = entry['attempts']
+print(f\"  Videos completed: {len(completed)}\")
+print(f\"  Videos failed: {len(failed)}\")
+print(f\"  Last checkpoint: {checkpoint.get('timestamp', 'Unknown')}\")
 "
     fi
     
@@ -0,0 +1,125 @@
+"""
+Shared test setup for the transcription scripts.
+
+The scripts live in scripts/ as plain modules, open ``../logs/*.log`` when they
+are imported, and pull in the Whisper/AWS stack at module level. This puts
+scripts/ on the path, runs the tests from a scratch directory with a sibling
+logs/ folder, and installs minimal stand-ins for the heavy packages that are
+not installed so the pure-Python logic can be tested without them.
+"""
+
+import math
+import os
+import shutil
+import sys
+import tempfile
+import types
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts')
+sys.path.insert(0, os.path.abspath(SCRIPTS_DIR))
+
+# logs/ next to the working directory, so ../logs/*.log resolves at import time
+SANDBOX = tempfile.mkdtemp(prefix='transcription-tests-')
+os.makedirs(os.path.join(SANDBOX, 'logs'))
+os.makedirs(os.path.join(SANDBOX, 'run'))
+os.chdir(os.path.join(SANDBOX, 'run'))
+
+
+def _install_stub(name, **attrs):
+    """Register an empty module under `name` (and on its parent) with the given attributes."""
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+    parent, _, child = name.rpartition('.')
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+def _unavailable(package):
+    def fail(*args, **kwargs):
+        raise RuntimeError(f"{package} is not installed")
+    return fail
+
+
+try:
+    import ctranslate2
+except ImportError:
+    _install_stub(
+        'ctranslate2',
+        get_cuda_device_count=lambda: 0,
+        get_supported_compute_types=lambda device: {'int8', 'int8_float32', 'float32'}
+    )
+
+try:
+    import faster_whisper
+except ImportError:
+    class VadOptions:
+        """Same fields and defaults as faster_whisper.vad.VadOptions."""
+        def __init__(self, threshold=0.5, neg_threshold=None, min_speech_duration_ms=0,
+                     max_speech_duration_s=math.inf, min_silence_duration_ms=2000,
+                     speech_pad_ms=400):
+            self.threshold = threshold
+            self.neg_threshold = neg_threshold
+            self.min_speech_duration_ms = min_speech_duration_ms
+            self.max_speech_duration_s = max_speech_duration_s
+            self.min_silence_duration_ms = min_silence_duration_ms
+            self.speech_pad_ms = speech_pad_ms
+
+    # No BatchedInferencePipeline, so the scripts take their sequential fallback
+    _install_stub(
+        'faster_whisper',
+        WhisperModel=_unavailable('faster-whisper'),
+        decode_audio=_unavailable('faster-whisper')
+    )
+    _install_stub(
+        'faster_whisper.vad',
+        VadOptions=VadOptions,
+        get_speech_timestamps=_unavailable('faster-whisper')
+    )
+
+try:
+    import botocore
+except ImportError:
+    class BotoCoreError(Exception):
+        def __init__(self, **kwargs):
+            super().__init__(kwargs)
+            self.kwargs = kwargs
+
+    class HTTPClientError(BotoCoreError):
+        pass
+
+    class ReadTimeoutError(HTTPClientError):
+        pass
+
+    class EndpointConnectionError(BotoCoreError):
+        pass
+
+    class ClientError(Exception):
+        def __init__(self, error_response, operation_name):
+            super().__init__(f"{operation_name}: {error_response}")
+            self.response = error_response
+            self.operation_name = operation_name
+
+    _install_stub('botocore', UNSIGNED=object())
+    _install_stub('botocore.config', Config=lambda **kwargs: kwargs)
+    _install_stub(
+        'botocore.exceptions',
+        BotoCoreError=BotoCoreError,
+        HTTPClientError=HTTPClientError,
+        ReadTimeoutError=ReadTimeoutError,
+        EndpointConnectionError=EndpointConnectionError,
+        ClientError=ClientError
+    )
+
+try:
+    import boto3
+except ImportError:
+    _install_stub('boto3', client=_unavailable('boto3'))
+    _install_stub('boto3.s3')
+    _install_stub('boto3.s3.transfer', TransferConfig=lambda **kwargs: kwargs)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    os.chdir(os.path.dirname(SANDBOX))
+    shutil.rmtree(SANDBOX, ignore_errors=True)
@@ -0,0 +1,74 @@
+"""
+Tests for retry classification in the robust batch runner.
+"""
+
+import json
+import os
+import signal
+import tempfile
+import unittest
+from unittest import mock
+
+import urllib3.exceptions
+from botocore.exceptions import ReadTimeoutError as BotocoreReadTimeoutError
+
+import batch_runner_with_monitoring as runner_module
+from batch_runner_with_monitoring import RecoverableError, RobustBatchRunner, classify_error
+
+
+class ClassifyErrorTest(unittest.TestCase):
+    def test_dropped_streams_are_recoverable(self):
+        errors = [
+            urllib3.exceptions.ProtocolError('Connection broken: ConnectionResetError'),
+            urllib3.exceptions.ReadTimeoutError(None, None, 'Read timed out.'),
+            BotocoreReadTimeoutError(endpoint_url='https://bucket.s3.amazonaws.com/video.mp4'),
+        ]
+        for error in errors:
+            self.assertIs(classify_error(error), RecoverableError, error)
+
+
+class ProcessVideoTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.addCleanup(os.chdir, cwd)
+        self.addCleanup(signal.signal, signal.SIGINT, signal.getsignal(signal.SIGINT))
+
+        self.video = {
+            'url': 'https://videos.example.com/week_1_class_1.mp4',
+            'cohort': 3,
+            'week': 1,
+            'lesson': 1,
+            'date': '2024-09-02',
+            'output_path': os.path.join(self.tmp.name, 'week_01', 'lesson_1')
+        }
+        with open('manifest.json', 'w') as f:
+            json.dump({'videos': [self.video]}, f)
+
+        self.runner = RobustBatchRunner('manifest.json', checkpoint_path='logs/checkpoint.json')
+        # Downloads fail before the model is used, so skip loading it
+        self.runner.transcriber.model = mock.Mock()
+
+    def test_raw_stream_failure_is_retried(self):
+        response = mock.MagicMock()
+        response.__enter__.return_value = response
+        response.headers = {'content-length': '1048576'}
+        response.raw.read.side_effect = urllib3.exceptions.ProtocolError(
+            'Connection broken: ConnectionResetError'
+        )
+
+        with mock.patch.object(self.runner.transcriber.session, 'get', return_value=response) as get, \
+                mock.patch.object(runner_module, 'retry_delay', return_value=0):
+            success = self.runner.process_video(self.video)
+
+        self.assertFalse(success)
+        # One attempt plus three retries, each counted toward the breaker
+        self.assertEqual(get.call_count, 4)
+        self.assertEqual(self.runner._consec_fail, 4)
+        self.assertNotIn('week_1_class_1', self.runner.permanent_failed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+"""
+Tests for transcript output, hashing and VAD clip handling in the batch transcriber.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import batch_transcriber
+from batch_transcriber import BatchTranscriber
+
+
+def _metadata():
+    return {
+        'source_file': 'week_01/class_1.mp4',
+        'duration_seconds': 12.0,
+        'language': 'en',
+        'language_probability': 0.99,
+        'model_used': 'base',
+        'transcription_timestamp': '2024-09-02 10:00:00',
+        'file_hash': 'abc123',
+        'hash_algorithm': 'md5',
+        'segment_count': 0,
+        'custom_metadata': {}
+    }
+
+
+def _segments(count, fail_after=None):
+    for i in range(count):
+        if fail_after is not None and i == fail_after:
+            raise RuntimeError("CUDA error: out of memory")
+        yield SimpleNamespace(start=i * 4.0, end=i * 4.0 + 3.5, text=f" segment {i} ")
+
+
+def _transcriber(hash_cache_path, **kwargs):
+    with mock.patch.object(batch_transcriber, 'HASH_CACHE_PATH', Path(hash_cache_path)):
+        return BatchTranscriber(device='cpu', **kwargs)
+
+
+class WriteTranscriptFileTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name) / 'out'
+        self.dir.mkdir()
+        self.output_path = self.dir / 'class_1_transcript.txt'
+        self.transcriber = _transcriber(Path(tmp.name) / 'file_hash_cache.json')
+
+    def test_writes_transcript_and_sidecar(self):
+        count = self.transcriber._write_transcript_file(_segments(3), self.output_path, _metadata())
+
+        self.assertEqual(count, 3)
+        text = self.output_path.read_text(encoding='utf-8')
+        self.assertIn("**Segments:** 3 ", text)
+        self.assertIn("segment 2", text)
+        self.assertTrue(self.output_path.with_suffix('.json').exists())
+        self.assertEqual(sorted(p.name for p in self.dir.iterdir()),
+                         ['class_1_transcript.json', 'class_1_transcript.txt'])
+
+    def test_failure_mid_transcription_leaves_no_partial_files(self):
+        with self.assertRaises(RuntimeError):
+            self.transcriber._write_transcript_file(_segments(5, fail_after=2), self.output_path, _metadata())
+
+        self.assertEqual(list(self.dir.iterdir()), [])
+
+    def test_failure_keeps_previous_transcript(self):
+        self.output_path.write_text("previous transcript", encoding='utf-8')
+
+        with self.assertRaises(RuntimeError):
+            self.transcriber._write_transcript_file(_segments(5, fail_after=1), self.output_path, _metadata())
+
+        self.assertEqual(self.output_path.read_text(encoding='utf-8'), "previous transcript")
+
+
+class HashCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.cache_path = self.dir / 'file_hash_cache.json'
+
+    def test_rewrite_within_the_same_second_is_rehashed(self):
+        video = self.dir / 'class_1.mp4'
+        second = 1_725_000_000 * 10**9
+        transcriber = _transcriber(self.cache_path)
+
+        video.write_bytes(b'aaaa')
+        os.utime(video, ns=(second, second + 100))
+        first = transcriber.get_file_hash(str(video))
+
+        video.write_bytes(b'bbbb')
+        os.utime(video, ns=(second, second + 900_000_000))
+        self.assertNotEqual(transcriber.get_file_hash(str(video)), first)
+
+    def test_unreadable_cache_is_ignored(self):
+        self.cache_path.mkdir()  # open() raises IsADirectoryError
+
+        transcriber = _transcriber(self.cache_path)
+
+        self.assertEqual(transcriber._hash_cache, {})
+
+    def test_save_merges_with_entries_saved_by_another_run(self):
+        video = self.dir / 'class_1.mp4'
+        video.write_bytes(b'aaaa')
+        other = self.dir / 'class_2.mp4'
+        other.write_bytes(b'bbbb')
+        first = _transcriber(self.cache_path)
+        second = _transcriber(self.cache_path)
+
+        first.get_file_hash(str(video))
+        second.get_file_hash(str(other))
+        first.save_hash_cache()
+        second.save_hash_cache()
+
+        saved = json.loads(self.cache_path.read_text())
+        self.assertEqual(len(saved), 2)
+        self.assertEqual(sorted(p.name for p in self.dir.iterdir()),
+                         ['class_1.mp4', 'class_2.mp4', 'file_hash_cache.json'])
+
+
+def _continuous_speech_vad(audio, vad_options):
+    """Stand-in for Silero on unbroken speech: one region, split only at the duration cap."""
+    rate = batch_transcriber.SAMPLING_RATE
+    cap = vad_options.max_speech_duration_s
+    step = len(audio) if cap == float('inf') else int(cap * rate) - rate  # Silero stops short of the cap
+    return [{'start': start, 'end': min(start + step, len(audio))} for start in range(0, len(audio), step)]
+
+
+class DetectSpeechTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.transcriber = _transcriber(Path(tmp.name) / 'file_hash_cache.json')
+        self.transcriber.pipeline = object()  # Batched clip format
+        # Five minutes of 16 kHz samples
+        self.audio = [0.0] * (5 * 60 * batch_transcriber.SAMPLING_RATE)
+
+    def test_five_minutes_of_speech_splits_into_windows(self):
+        with mock.patch.object(batch_transcriber, 'get_speech_timestamps', side_effect=_continuous_speech_vad):
+            clips = self.transcriber.detect_speech(self.audio)
+
+        self.assertGreater(len(clips), 1)
+        for clip in clips:
+            self.assertLessEqual(clip['end'] - clip['start'], batch_transcriber.BATCH_CHUNK_SECONDS)
+        # Seconds, covering the whole lecture
+        self.assertEqual(clips[0]['start'], 0)
+        self.assertEqual(clips[-1]['end'], 300)
+
+    def test_short_regions_are_packed_into_windows(self):
+        rate = batch_transcriber.SAMPLING_RATE
+        regions = [{'start': i * 6 * rate, 'end': (i * 6 + 5) * rate} for i in range(50)]
+        with mock.patch.object(batch_transcriber, 'get_speech_timestamps', return_value=regions):
+            clips = self.transcriber.detect_speech(self.audio)
+
+        self.assertEqual(clips[0], {'start': 0, 'end': 29})
+        self.assertEqual(len(clips), 10)
+
+    def test_no_speech(self):
+        with mock.patch.object(batch_transcriber, 'get_speech_timestamps', return_value=[]):
+            self.assertIsNone(self.transcriber.detect_speech(self.audio))
+
+
+class TranscribeInThreadsTest(unittest.TestCase):
+    def test_decoded_audio_is_bounded(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        transcriber = _transcriber(Path(tmp.name) / 'file_hash_cache.json', decode_workers=4)
+        transcriber.model = object()
+        videos = [Path(tmp.name) / 'week_01' / f'class_{i}.mp4' for i in range(8)]
+        lock = threading.Lock()
+        live = []
+        peak = []
+
+        def decode_audio(path, sampling_rate):
+            with lock:
+                live.append(path)
+                peak.append(len(live))
+            return path
+
+        def transcribe_single_file(video_path, output_path, metadata, audio=None, clip_timestamps=None):
+            time.sleep(0.01)
+            with lock:
+                live.remove(audio)
+            return {'success': True}
+
+        with mock.patch.object(batch_transcriber, 'decode_audio', decode_audio), \
+                mock.patch.object(transcriber, 'detect_speech', return_value=None), \
+                mock.patch.object(transcriber, 'transcribe_single_file', transcribe_single_file):
+            results = transcriber._transcribe_in_threads(videos, 'cohort_3')
+
+        self.assertEqual([r['file'] for r in results], [str(v) for v in videos])
+        self.assertLessEqual(max(peak), batch_transcriber.AUDIO_BUFFERS)
+
+
+if __name__ == '__main__':
+    unittest.main()
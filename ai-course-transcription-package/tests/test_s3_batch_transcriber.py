@@ -0,0 +1,82 @@
+"""
+Tests for the process-pool manifest path of the S3 batch transcriber.
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest import mock
+
+import s3_batch_transcriber
+from s3_batch_transcriber import S3BatchTranscriber
+
+
+class _Pool:
+    """ProcessPoolExecutor stand-in whose submit is supplied by the test."""
+    def __init__(self, submit):
+        self.submit = submit
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _broken_submit(*args, **kwargs):
+    raise BrokenProcessPool("A process in the process pool was terminated abruptly")
+
+
+def _crashed_worker(*args, **kwargs):
+    future = Future()
+    future.set_exception(BrokenProcessPool("A process in the process pool was terminated abruptly"))
+    return future
+
+
+class ProcessInProcessesTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.transcriber = S3BatchTranscriber(max_workers=2, processes=1)
+        self.jobs = [
+            (f"https://videos.example.com/class_{i}.mp4", os.path.join(self.dir, f"class_{i}"), {})
+            for i in range(6)
+        ]
+
+    def _download(self, url):
+        temp_path = os.path.join(self.dir, os.path.basename(url))
+        with open(temp_path, 'wb') as f:
+            f.write(b'video')
+        return temp_path
+
+    def _run(self, submit):
+        pool = lambda **kwargs: _Pool(submit)
+        with mock.patch.object(s3_batch_transcriber, 'ProcessPoolExecutor', pool), \
+                mock.patch.object(self.transcriber, 'download', side_effect=self._download):
+            # More jobs than disk slots, so a leaked slot blocks the download loop
+            runner = threading.Thread(target=self.transcriber._process_in_processes, args=(self.jobs,), daemon=True)
+            runner.start()
+            runner.join(timeout=10)
+        self.assertFalse(runner.is_alive(), "download loop is waiting on a leaked disk slot")
+
+    def test_failed_submit_releases_slot_and_records_failure(self):
+        self._run(_broken_submit)
+
+        failed = self.transcriber.stats['failed_files']
+        self.assertEqual(sorted(f['url'] for f in failed), sorted(job[0] for job in self.jobs))
+        self.assertIn("terminated abruptly", failed[0]['error'])
+        self.assertEqual(os.listdir(self.dir), [])
+
+    def test_crashed_worker_removes_downloaded_file(self):
+        self._run(_crashed_worker)
+
+        self.assertEqual(len(self.transcriber.stats['failed_files']), len(self.jobs))
+        self.assertEqual(os.listdir(self.dir), [])
+
+
+if __name__ == '__main__':
+    unittest.main()